@@ -5,13 +5,35 @@ Exports signal strength data to KML/KMZ format for Google Earth visualization
 
 import simplekml
 import logging
+import zipfile
+from contextlib import ExitStack, contextmanager
+from io import BytesIO
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 import pandas as pd
 import numpy as np
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+KML_NAMESPACE = 'http://www.opengis.net/kml/2.2'
+
+# Signal range is quantized into this many shared placemark styles
+COLOR_BINS = 32
+
+# Placemarks written between explicit flushes of the streamed KML writer
+FLUSH_EVERY = 1000
+
+# Deflate level for KMZ output (zlib default trade-off of speed vs size)
+KMZ_COMPRESSLEVEL = 6
+
+# Exports at least this large render bands in worker processes
+PARALLEL_MIN_POINTS = 200_000
+
+# Two-digit hex string for every byte value, indexed by channel value
+_HEX256 = np.array([f'{i:02x}' for i in range(256)], dtype='U2')
+
 
 class KMLExporter:
     """Exports signal measurement data to KML format for Google Earth"""
@@ -28,42 +50,239 @@ class KMLExporter:
                                else config['visualization']['output_dir'])
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _signal_to_color(self, signal_dbm: float) -> str:
+        # Every point style shares one icon
+        self._icon_href = 'http://maps.google.com/mapfiles/kml/shapes/placemark_circle.png'
+
+        # Signal range mapped onto the color ramp
+        self._vmin = config['visualization']['min_signal_threshold']
+        self._vmax = config['visualization']['max_signal_threshold']
+
+        # Color palette only depends on the configured thresholds, so build it once
+        self._point_styles = self._build_point_styles()
+
+        # (source frame, row count, GPS-only rows) from the last export call
+        self._gps_cache: Optional[Tuple[pd.DataFrame, int, pd.DataFrame]] = None
+
+    def _gps_filtered(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Convert signal strength to color hex code
+        Get the rows of df that have a GPS position
+
+        Running several exports on the same frame reuses the filtered rows
+        instead of rescanning it each time.
 
         Args:
-            signal_dbm: Signal strength in dBm
+            df: DataFrame containing measurements
 
         Returns:
-            KML color string (AABBGGRR format)
+            DataFrame restricted to rows with latitude and longitude
         """
-        vmin = self.config['visualization']['min_signal_threshold']
-        vmax = self.config['visualization']['max_signal_threshold']
-
-        # Normalize signal to 0-1 range
-        normalized = (signal_dbm - vmin) / (vmax - vmin)
-        normalized = np.clip(normalized, 0, 1)
-
-        # Color gradient: Red (weak) -> Yellow -> Green (strong)
-        if normalized < 0.5:
-            # Red to Yellow
-            r = 255
-            g = int(255 * (normalized * 2))
-            b = 0
-        else:
-            # Yellow to Green
-            r = int(255 * (2 - normalized * 2))
-            g = 255
-            b = 0
+        cached = self._gps_cache
+        if cached is not None and cached[0] is df and cached[1] == len(df):
+            return cached[2]
+
+        has_gps = df['latitude'].notna().to_numpy() & df['longitude'].notna().to_numpy()
+        df_gps = df[has_gps]
+        self._gps_cache = (df, len(df), df_gps)
+        return df_gps
+
+    def _signals_to_colors(self, signals: np.ndarray) -> np.ndarray:
+        """
+        Convert an array of signal strengths to color hex codes in one pass
+
+        Args:
+            signals: Signal strengths in dBm
+
+        Returns:
+            Array of KML color strings (AABBGGRR format), same order as signals
+        """
+        vmin, vmax = self._vmin, self._vmax
+
+        normalized = np.clip((np.asarray(signals, dtype=float) - vmin) / (vmax - vmin), 0, 1)
+
+        # Color gradient: Red (weak) -> Yellow -> Green (strong). Red stays at 255
+        # over the lower half and fades out over the upper half; green rises over
+        # the lower half and stays at 255 above it
+        r = (np.clip(2.0 - 2.0 * normalized, 0.0, 1.0) * 255.0).astype(np.uint8)
+        g = (np.clip(2.0 * normalized, 0.0, 1.0) * 255.0).astype(np.uint8)
+        b = np.zeros_like(r)
 
         # KML format is AABBGGRR (alpha, blue, green, red)
-        return f"ff{b:02x}{g:02x}{r:02x}"
+        return np.char.add('ff', np.char.add(_HEX256[b], np.char.add(_HEX256[g], _HEX256[r])))
+
+    def _signals_to_bins(self, signals: np.ndarray) -> np.ndarray:
+        """
+        Map signal strengths to shared style bin indices
+
+        Args:
+            signals: Signal strengths in dBm
+
+        Returns:
+            Integer array of bin indices in [0, COLOR_BINS)
+        """
+        vmin, vmax = self._vmin, self._vmax
+
+        normalized = np.nan_to_num((np.asarray(signals, dtype=float) - vmin) / (vmax - vmin))
+        return np.clip((normalized * COLOR_BINS).astype(int), 0, COLOR_BINS - 1)
+
+    def _build_point_styles(self) -> List[etree._Element]:
+        """
+        Create one placemark style per color bin, shared by all points in a document
+
+        Returns:
+            List of COLOR_BINS <Style> elements indexed by bin (ids signal_0..)
+        """
+        vmin, vmax = self._vmin, self._vmax
+
+        # Color each bin by the signal at its center
+        centers = vmin + (np.arange(COLOR_BINS) + 0.5) / COLOR_BINS * (vmax - vmin)
+
+        return [
+            self._style_element(f"signal_{i}", color, 0.8,
+                                icon_href=self._icon_href, label_scale=0.7)
+            for i, color in enumerate(self._signals_to_colors(centers))
+        ]
+
+    @staticmethod
+    def _style_element(style_id: str, color: str, scale: float,
+                       icon_href: Optional[str] = None,
+                       label_scale: Optional[float] = None) -> etree._Element:
+        """
+        Build a shared point <Style> element
+
+        Args:
+            style_id: Style id referenced by placemarks as #style_id
+            color: Icon color (AABBGGRR format)
+            scale: Icon scale
+            icon_href: Optional icon image URL
+            label_scale: Optional label scale
+
+        Returns:
+            Style element
+        """
+        style = etree.Element('Style', id=style_id)
+        icon_style = etree.SubElement(style, 'IconStyle')
+        etree.SubElement(icon_style, 'color').text = color
+        etree.SubElement(icon_style, 'scale').text = str(scale)
+        if icon_href is not None:
+            icon = etree.SubElement(icon_style, 'Icon')
+            etree.SubElement(icon, 'href').text = icon_href
+        if label_scale is not None:
+            label_style = etree.SubElement(style, 'LabelStyle')
+            etree.SubElement(label_style, 'scale').text = str(label_scale)
+        return style
+
+    @staticmethod
+    def _name_element(name: str) -> etree._Element:
+        """Build a <name> element"""
+        element = etree.Element('name')
+        element.text = name
+        return element
+
+    @staticmethod
+    def _placemark_element(name: str, style_url: str, coords: str,
+                           description: Optional[str] = None) -> etree._Element:
+        """
+        Build a point <Placemark> element
+
+        Args:
+            name: Placemark label
+            style_url: Reference to a shared style (#style_id)
+            coords: Coordinates as "lon,lat,alt"
+            description: Optional HTML description (wrapped in CDATA)
+
+        Returns:
+            Placemark element
+        """
+        placemark = etree.Element('Placemark')
+        etree.SubElement(placemark, 'name').text = name
+        if description is not None:
+            etree.SubElement(placemark, 'description').text = etree.CDATA(description)
+        etree.SubElement(placemark, 'styleUrl').text = style_url
+        point = etree.SubElement(placemark, 'Point')
+        etree.SubElement(point, 'coordinates').text = coords
+        return placemark
+
+    @contextmanager
+    def _open_kml_target(self, path: Path, compress: bool = False) -> Iterator[BinaryIO]:
+        """
+        Open the binary stream a KML document is written into
+
+        Args:
+            path: Output KML/KMZ path
+            compress: Write a KMZ archive (doc.kml deflated inside a zip)
+
+        Yields:
+            Writable binary file object
+        """
+        with ExitStack() as stack:
+            if compress:
+                zf = stack.enter_context(zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED,
+                                                         compresslevel=KMZ_COMPRESSLEVEL))
+                yield stack.enter_context(zf.open('doc.kml', 'w'))
+            else:
+                yield stack.enter_context(open(path, 'wb'))
+
+    @contextmanager
+    def _write_kml_streamed(self, path: Path, doc_name: str,
+                            styles: List[etree._Element],
+                            compress: bool = False) -> Iterator[etree.xmlfile]:
+        """
+        Stream a KML document to disk instead of building it in memory
+
+        Args:
+            path: Output KML/KMZ path
+            doc_name: Document name
+            styles: Shared <Style> elements written at the top of the document
+            compress: Write a KMZ archive (doc.kml deflated inside a zip)
+
+        Yields:
+            lxml incremental writer positioned inside <Document>
+        """
+        with self._open_kml_target(path, compress) as target:
+            with etree.xmlfile(target, encoding='utf-8') as xf:
+                xf.write_declaration()
+                with xf.element('kml', nsmap={None: KML_NAMESPACE}):
+                    with xf.element('Document'):
+                        xf.write(self._name_element(doc_name))
+                        for style in styles:
+                            xf.write(style)
+                        yield xf
+
+    def _write_kml_fragments(self, path: Path, doc_name: str,
+                             styles: List[etree._Element],
+                             fragments: Iterator[bytes],
+                             compress: bool = False):
+        """
+        Stitch pre-serialized <Folder> fragments into a KML document
+
+        Args:
+            path: Output KML/KMZ path
+            doc_name: Document name
+            styles: Shared <Style> elements written at the top of the document
+            fragments: Serialized folders, written in the order produced
+            compress: Write a KMZ archive (doc.kml deflated inside a zip)
+        """
+        with self._open_kml_target(path, compress) as target:
+            target.write(b"<?xml version='1.0' encoding='utf-8'?>\n")
+            target.write(f'<kml xmlns="{KML_NAMESPACE}"><Document>'.encode('utf-8'))
+            target.write(etree.tostring(self._name_element(doc_name), encoding='utf-8'))
+            for style in styles:
+                target.write(etree.tostring(style, encoding='utf-8'))
+            for fragment in fragments:
+                target.write(fragment)
+            target.write(b'</Document></kml>')
+
+    @staticmethod
+    def _output_suffix(output_filename: str, compress: bool) -> str:
+        """Match the output filename extension to the requested format"""
+        return str(Path(output_filename).with_suffix('.kmz' if compress else '.kml'))
 
     def export_to_kml(self,
                       df: pd.DataFrame,
                       output_filename: str = "signal_map.kml",
-                      include_paths: bool = False) -> Path:
+                      include_paths: bool = False,
+                      compress: bool = True,
+                      processes: Optional[int] = None) -> Path:
         """
         Export measurements to KML file
 
@@ -71,113 +290,144 @@ class KMLExporter:
             df: DataFrame containing measurements
             output_filename: Output filename
             include_paths: Whether to draw paths between measurement points
+            compress: Save as KMZ (extension is switched to .kmz)
+            processes: Worker processes for rendering bands of large exports
+                (None = one per CPU, 1 = always render in this process)
 
         Returns:
-            Path to saved KML file
+            Path to saved KML/KMZ file
         """
-        kml = simplekml.Kml(name="Cell Signal Strength Map")
-
         # Remove rows without GPS
-        df_gps = df.dropna(subset=['latitude', 'longitude'])
+        df_gps = self._gps_filtered(df)
 
         if df_gps.empty:
             logger.warning("No GPS data to export")
             return None
 
-        # Group by band
-        bands = df_gps['band'].unique()
+        output_path = self.output_dir / self._output_suffix(output_filename, compress)
 
-        for band_name in bands:
-            band_data = df_gps[df_gps['band'] == band_name].copy()
+        # Group by band (single hashed pass, keeps order of first appearance)
+        bands = list(df_gps.groupby('band', sort=False))
 
-            # Create folder for this band
-            band_folder = kml.newfolder(name=band_name)
+        if processes != 1 and len(bands) > 1 and len(df_gps) >= PARALLEL_MIN_POINTS:
+            # Bands are independent folders: serialize them in parallel and stitch
+            # the fragments together in band order
+            with Pool(processes, initializer=_init_render_worker, initargs=(self.config,)) as pool:
+                fragments = pool.imap(_render_band_xml,
+                                      [(band_name, band_data, include_paths)
+                                       for band_name, band_data in bands])
+                self._write_kml_fragments(output_path, "Cell Signal Strength Map",
+                                          self._point_styles, fragments, compress)
+        else:
+            # Placemark styles are shared across the whole document
+            with self._write_kml_streamed(output_path, "Cell Signal Strength Map",
+                                          self._point_styles, compress) as xf:
+                for band_name, band_data in bands:
+                    self._write_band(xf, band_name, band_data, include_paths)
+
+        logger.info(f"Exported {len(df_gps)} points to {output_path}")
+        return output_path
+
+    def _write_band(self, xf: etree.xmlfile, band_name: str, band_data: pd.DataFrame,
+                    include_paths: bool = False):
+        """
+        Stream one band's folder (optionally split into altitude layers)
+
+        Args:
+            xf: lxml incremental writer
+            band_name: Band label used as the folder name
+            band_data: Measurements for this band
+            include_paths: Whether to draw paths between points
+        """
+        # Create folder for this band
+        with xf.element('Folder'):
+            xf.write(self._name_element(band_name))
 
             # If altitude layers are enabled, group by altitude
             if self.config['export']['altitude_layers'] and band_data['altitude'].notna().any():
-                altitudes = band_data['altitude'].dropna().unique()
-                altitudes = np.round(altitudes / 5) * 5  # Round to nearest 5m
-                altitudes = np.unique(altitudes)
-
-                for altitude in altitudes:
-                    alt_data = band_data[
-                        (band_data['altitude'] >= altitude - 5) &
-                        (band_data['altitude'] <= altitude + 5)
-                    ]
-
-                    if not alt_data.empty:
-                        alt_folder = band_folder.newfolder(name=f"{int(altitude)}m altitude")
-                        self._add_points_to_folder(alt_folder, alt_data, include_paths)
+                # Round to nearest 5m; rows without altitude fall out of every bucket
+                buckets = (band_data['altitude'] / 5).round().mul(5).astype('Int64')
+
+                for altitude, alt_data in band_data.groupby(buckets, dropna=True):
+                    with xf.element('Folder'):
+                        xf.write(self._name_element(f"{altitude}m altitude"))
+                        self._write_points(xf, alt_data, include_paths)
             else:
                 # No altitude separation
-                self._add_points_to_folder(band_folder, band_data, include_paths)
+                self._write_points(xf, band_data, include_paths)
 
-        # Save
-        output_path = self.output_dir / output_filename
-        kml.save(str(output_path))
-
-        logger.info(f"Exported {len(df_gps)} points to {output_path}")
-        return output_path
-
-    def _add_points_to_folder(self, folder, df: pd.DataFrame, include_paths: bool = False):
+    def _write_points(self, xf: etree.xmlfile, df: pd.DataFrame, include_paths: bool = False):
         """
-        Add measurement points to a KML folder
+        Stream measurement placemarks into the currently open KML folder
 
         Args:
-            folder: KML folder object
+            xf: lxml incremental writer from _write_kml_streamed
             df: DataFrame with measurements
             include_paths: Whether to draw paths between points
         """
-        # Sort by timestamp if available
+        # Visit points in timestamp order (if available) without copying the frame
         if 'timestamp' in df.columns:
-            df = df.sort_values('timestamp')
+            order = np.argsort(df['timestamp'].to_numpy(), kind='stable')
+        else:
+            order = np.arange(len(df))
+
+        # Pull geometry columns out of pandas once; missing altitude becomes 0
+        lats = df['latitude'].to_numpy()
+        lons = df['longitude'].to_numpy()
+        if 'altitude' in df.columns:
+            alts = np.nan_to_num(df['altitude'].to_numpy(dtype=float), nan=0.0)
+        else:
+            alts = np.zeros(len(df))
+        signals = df['signal_dbm'].to_numpy()
+
+        # Build all placemark descriptions up front with vectorized string ops
+        alt_col = pd.Series(alts, index=df.index)
+        alt_str = alt_col.map('{:.1f} m'.format).where(alt_col != 0, 'N/A')
+        if 'timestamp' not in df.columns:
+            time_str = 'N/A'
+        elif pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            time_str = df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S').fillna('N/A')
+        else:
+            time_str = df['timestamp'].fillna('N/A').astype(str)
+
+        descs = ("<b>Signal Strength:</b> " + df['signal_dbm'].map('{:.2f}'.format) +
+                 " dBm<br/><b>Frequency:</b> " + df['frequency_mhz'].map('{:.2f}'.format) +
+                 " MHz<br/><b>Band:</b> " + df['band'].astype(str) +
+                 "<br/><b>Location:</b> " + df['latitude'].map('{:.6f}'.format) +
+                 ", " + df['longitude'].map('{:.6f}'.format) +
+                 "<br/><b>Altitude:</b> " + alt_str +
+                 "<br/><b>Time:</b> " + time_str).to_numpy()[order]
+
+        lats = lats[order]
+        lons = lons[order]
+        alts = alts[order]
+        signals = signals[order]
+
+        style_bins = self._signals_to_bins(signals)
+        coords = [f"{lon},{lat},{alt}" for lon, lat, alt in zip(lons.tolist(), lats.tolist(), alts.tolist())]
 
         # Add placemarks for each measurement
-        for idx, row in df.iterrows():
-            lat = row['latitude']
-            lon = row['longitude']
-            alt = row.get('altitude', 0)
-            # Handle None altitude
-            if alt is None or (isinstance(alt, float) and alt != alt):  # Check for None or NaN
-                alt = 0
-            signal = row['signal_dbm']
-            freq = row['frequency_mhz']
-
-            # Create placemark
-            pnt = folder.newpoint()
-            pnt.coords = [(lon, lat, alt)]
-
-            # Name and description
-            pnt.name = f"{signal:.1f} dBm"
-            alt_str = f"{alt:.1f} m" if alt != 0 else "N/A"
-            pnt.description = f"""
-            <![CDATA[
-            <b>Signal Strength:</b> {signal:.2f} dBm<br/>
-            <b>Frequency:</b> {freq:.2f} MHz<br/>
-            <b>Band:</b> {row['band']}<br/>
-            <b>Location:</b> {lat:.6f}, {lon:.6f}<br/>
-            <b>Altitude:</b> {alt_str}<br/>
-            <b>Time:</b> {row.get('timestamp', 'N/A')}
-            ]]>
-            """
-
-            # Style based on signal strength
-            color = self._signal_to_color(signal)
-            pnt.style.iconstyle.color = color
-            pnt.style.iconstyle.scale = 0.8
-            pnt.style.iconstyle.icon.href = 'http://maps.google.com/mapfiles/kml/shapes/placemark_circle.png'
-
-            # Label style
-            pnt.style.labelstyle.scale = 0.7
+        for i in range(len(df)):
+            xf.write(self._placemark_element(
+                name=f"{signals[i]:.1f} dBm",
+                style_url=f"#signal_{style_bins[i]}",
+                coords=coords[i],
+                description=descs[i]
+            ))
+
+            if (i + 1) % FLUSH_EVERY == 0:
+                xf.flush()
 
         # Add path connecting points
         if include_paths and len(df) > 1:
-            linestring = folder.newlinestring(name="Measurement Path")
-            coords = [(row['longitude'], row['latitude'], row.get('altitude', 0))
-                     for _, row in df.iterrows()]
-            linestring.coords = coords
-            linestring.style.linestyle.color = 'ff0000ff'  # Red line
-            linestring.style.linestyle.width = 2
+            path = etree.Element('Placemark')
+            etree.SubElement(path, 'name').text = "Measurement Path"
+            line_style = etree.SubElement(etree.SubElement(path, 'Style'), 'LineStyle')
+            etree.SubElement(line_style, 'color').text = 'ff0000ff'  # Red line
+            etree.SubElement(line_style, 'width').text = '2'
+            linestring = etree.SubElement(path, 'LineString')
+            etree.SubElement(linestring, 'coordinates').text = ' '.join(coords)
+            xf.write(path)
 
     def export_heatmap_overlay(self,
                               df: pd.DataFrame,
@@ -198,7 +448,7 @@ class KMLExporter:
         kml = simplekml.Kml(name="Signal Strength Overlay")
 
         # Calculate bounds
-        df_gps = df.dropna(subset=['latitude', 'longitude'])
+        df_gps = self._gps_filtered(df)
 
         if df_gps.empty:
             logger.warning("No GPS data for overlay")
@@ -239,7 +489,8 @@ class KMLExporter:
     def export_coverage_zones(self,
                              df: pd.DataFrame,
                              threshold_dbm: float = -100,
-                             output_filename: str = "coverage_zones.kml") -> Path:
+                             output_filename: str = "coverage_zones.kml",
+                             compress: bool = True) -> Path:
         """
         Export coverage zones (good/weak signal areas) to KML
 
@@ -247,45 +498,91 @@ class KMLExporter:
             df: DataFrame containing measurements
             threshold_dbm: Signal threshold for good coverage
             output_filename: Output filename
+            compress: Save as KMZ (extension is switched to .kmz)
 
         Returns:
-            Path to KML file
+            Path to KML/KMZ file
         """
-        kml = simplekml.Kml(name="Coverage Zones")
-
-        df_gps = df.dropna(subset=['latitude', 'longitude'])
+        df_gps = self._gps_filtered(df)
 
         if df_gps.empty:
             logger.warning("No GPS data for coverage zones")
             return None
 
-        # Create folders for good and weak coverage
-        good_folder = kml.newfolder(name=f"Good Coverage (≥{threshold_dbm} dBm)")
-        weak_folder = kml.newfolder(name=f"Weak Coverage (<{threshold_dbm} dBm)")
-
-        good_points = df_gps[df_gps['signal_dbm'] >= threshold_dbm]
-        weak_points = df_gps[df_gps['signal_dbm'] < threshold_dbm]
-
-        # Add good coverage points
-        for _, row in good_points.iterrows():
-            pnt = good_folder.newpoint()
-            pnt.coords = [(row['longitude'], row['latitude'], row.get('altitude', 0))]
-            pnt.name = f"{row['signal_dbm']:.1f} dBm"
-            pnt.style.iconstyle.color = 'ff00ff00'  # Green
-            pnt.style.iconstyle.scale = 0.6
-
-        # Add weak coverage points
-        for _, row in weak_points.iterrows():
-            pnt = weak_folder.newpoint()
-            pnt.coords = [(row['longitude'], row['latitude'], row.get('altitude', 0))]
-            pnt.name = f"{row['signal_dbm']:.1f} dBm"
-            pnt.style.iconstyle.color = 'ff0000ff'  # Red
-            pnt.style.iconstyle.scale = 0.6
-
-        output_path = self.output_dir / output_filename
-        kml.save(str(output_path))
+        # Work on plain column arrays; missing altitude is written as ground level
+        lons = df_gps['longitude'].to_numpy()
+        lats = df_gps['latitude'].to_numpy()
+        signals = df_gps['signal_dbm'].to_numpy()
+        if 'altitude' in df_gps.columns:
+            alts = df_gps['altitude'].fillna(0.0).to_numpy()
+        else:
+            alts = np.zeros(len(df_gps))
+
+        # One shared style per zone
+        styles = [
+            self._style_element('good', 'ff00ff00', 0.6),  # Green
+            self._style_element('weak', 'ff0000ff', 0.6),  # Red
+        ]
+
+        # Split good/weak coverage with one mask instead of copying frames
+        good = signals >= threshold_dbm
+        counts = {True: int(good.sum())}
+        counts[False] = len(good) - counts[True]
+
+        output_path = self.output_dir / self._output_suffix(output_filename, compress)
+
+        with self._write_kml_streamed(output_path, "Coverage Zones", styles, compress) as xf:
+            # Create folders for good and weak coverage
+            for rows, folder_name, style_url in (
+                (np.flatnonzero(good), f"Good Coverage (≥{threshold_dbm} dBm)", '#good'),
+                (np.flatnonzero(~good), f"Weak Coverage (<{threshold_dbm} dBm)", '#weak'),
+            ):
+                zone_lons = lons[rows].tolist()
+                zone_lats = lats[rows].tolist()
+                zone_alts = alts[rows].tolist()
+                zone_signals = signals[rows].tolist()
+
+                with xf.element('Folder'):
+                    xf.write(self._name_element(folder_name))
+
+                    for i in range(len(rows)):
+                        xf.write(self._placemark_element(
+                            name=f"{zone_signals[i]:.1f} dBm",
+                            style_url=style_url,
+                            coords=f"{zone_lons[i]},{zone_lats[i]},{zone_alts[i]}"
+                        ))
+
+                        if (i + 1) % FLUSH_EVERY == 0:
+                            xf.flush()
 
         logger.info(f"Exported coverage zones to {output_path}")
-        logger.info(f"Good coverage: {len(good_points)} points, Weak: {len(weak_points)} points")
+        logger.info(f"Good coverage: {counts[True]} points, Weak: {counts[False]} points")
 
         return output_path
+
+
+# Exporter used by band-rendering worker processes (set by _init_render_worker)
+_worker_exporter: Optional[KMLExporter] = None
+
+
+def _init_render_worker(config: Dict):
+    """Create the per-process exporter used by _render_band_xml"""
+    global _worker_exporter
+    _worker_exporter = KMLExporter(config)
+
+
+def _render_band_xml(task: Tuple[str, pd.DataFrame, bool]) -> bytes:
+    """
+    Serialize one band's <Folder> in a worker process
+
+    Args:
+        task: (band_name, band_data, include_paths)
+
+    Returns:
+        UTF-8 encoded <Folder>...</Folder> fragment
+    """
+    band_name, band_data, include_paths = task
+    buf = BytesIO()
+    with etree.xmlfile(buf, encoding='utf-8') as xf:
+        _worker_exporter._write_band(xf, band_name, band_data, include_paths)
+    return buf.getvalue()
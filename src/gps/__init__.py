@@ -1,7 +1,7 @@
 """GPS module for coordinate acquisition"""
 
-from .gps_module import GPSReader, GPSCoordinate, MockGPSReader
-from .windows_gps import WindowsGPSReader
+from .gps_module import GPSReader, GPSCoordinate, MockGPSReader, NullGPSReader
+from .windows_gps import WindowsGPSReader, WINRT_AVAILABLE
 
 # MAVLink GPS support (Pixhawk/PX4)
 try:
@@ -16,8 +16,10 @@ __all__ = [
     'GPSReader',
     'GPSCoordinate',
     'MockGPSReader',
+    'NullGPSReader',
     'WindowsGPSReader',
     'MAVLinkGPSReader',
     'MAVLinkGPSReaderWithCompass',
-    'MAVLINK_AVAILABLE'
+    'MAVLINK_AVAILABLE',
+    'WINRT_AVAILABLE'
 ]
@@ -4,11 +4,14 @@ Handles GPS coordinate acquisition from serial GPS devices
 Optional: HMC5883L compass support via I2C
 """
 
+import re
 import serial
 import pynmea2
 import logging
 from typing import Optional, Tuple, Dict
 from datetime import datetime
+from functools import reduce
+from operator import xor
 import time
 
 logger = logging.getLogger(__name__)
@@ -45,6 +48,11 @@ class GPSCoordinate:
 class GPSReader:
     """Interface for reading GPS data from serial device"""
 
+    # GGA fields: time, lat, N/S, lon, E/W, fix quality, satellites, HDOP, altitude
+    _GGA_RE = re.compile(
+        rb'^\$G[A-Z]GGA,([^,]*),([^,]*),([NS]),([^,]*),([EW]),(\d),(\d+),([^,]*),([^,]*),M,'
+    )
+
     def __init__(self, config: Dict):
         """
         Initialize GPS reader
@@ -57,6 +65,10 @@ class GPSReader:
         self.is_connected = False
         self.last_valid_position: Optional[GPSCoordinate] = None
 
+        # Settings consulted on every received sentence
+        self._gps_enabled = config['gps']['enabled']
+        self._min_sats = config['gps'].get('min_satellites', 4)
+
     def connect(self) -> bool:
         """
         Connect to GPS device and optional compass
@@ -64,7 +76,7 @@ class GPSReader:
         Returns:
             True if successful, False otherwise
         """
-        if not self.config['gps']['enabled']:
+        if not self._gps_enabled:
             logger.info("GPS is disabled in configuration")
             return False
 
@@ -102,43 +114,50 @@ class GPSReader:
             logger.warning("GPS not connected")
             return self.last_valid_position
 
+        min_sats = self._min_sats
+        debug = logger.isEnabledFor(logging.DEBUG)
         start_time = time.time()
 
         while (time.time() - start_time) < timeout:
             try:
-                line = self.serial_port.readline().decode('ascii', errors='ignore').strip()
+                line = self.serial_port.readline().strip()
 
                 if not line:
                     continue
 
-                # Try to parse NMEA sentence
-                if line.startswith('$'):
-                    try:
-                        msg = pynmea2.parse(line)
-
-                        # Parse GGA sentence (position fix)
-                        if isinstance(msg, pynmea2.types.talker.GGA):
-                            if msg.latitude and msg.longitude:
-                                coord = GPSCoordinate(
-                                    latitude=msg.latitude,
-                                    longitude=msg.longitude,
-                                    altitude=msg.altitude if msg.altitude else None,
-                                    num_satellites=msg.num_sats if msg.num_sats else 0,
-                                    timestamp=datetime.now()
-                                )
-
-                                # Check if fix is valid
-                                min_sats = self.config['gps']['min_satellites']
-                                if coord.is_valid(min_sats):
-                                    self.last_valid_position = coord
-                                    logger.debug(f"GPS fix: {coord}")
-                                    return coord
-                                else:
-                                    logger.debug(f"GPS fix insufficient: {coord.num_satellites} sats < {min_sats} required")
-
-                    except pynmea2.ParseError:
-                        # Ignore malformed sentences
-                        pass
+                # Fast path: GGA sentence (position fix) matched straight from bytes
+                match = self._GGA_RE.match(line)
+                if match:
+                    fix = self._fast_parse_gga(line, match)
+                elif line.startswith(b'$') and line[3:6] == b'GGA':
+                    # GGA the pattern doesn't cover (e.g. empty fields while
+                    # there is no fix) goes through pynmea2
+                    fix = self._parse_nmea(line)
+                else:
+                    # RMC/GSA/GSV/VTG and the like carry no fix; skip unparsed
+                    continue
+
+                if fix is None:
+                    continue
+
+                lat, lon, alt, num_sats = fix
+                if lat and lon:
+                    coord = GPSCoordinate(
+                        latitude=lat,
+                        longitude=lon,
+                        altitude=alt,
+                        num_satellites=num_sats,
+                        timestamp=datetime.now()
+                    )
+
+                    # Check if fix is valid
+                    if coord.is_valid(min_sats):
+                        self.last_valid_position = coord
+                        if debug:
+                            logger.debug(f"GPS fix: {coord}")
+                        return coord
+                    elif debug:
+                        logger.debug(f"GPS fix insufficient: {coord.num_satellites} sats < {min_sats} required")
 
             except Exception as e:
                 logger.error(f"Error reading GPS data: {e}")
@@ -148,6 +167,73 @@ class GPSReader:
         logger.warning(f"GPS timeout after {timeout}s")
         return self.last_valid_position
 
+    @staticmethod
+    def _fast_parse_gga(line: bytes, match: re.Match) -> Optional[Tuple[float, float, Optional[float], int]]:
+        """
+        Convert a GGA sentence matched by _GGA_RE into a position fix
+
+        Args:
+            line: Raw NMEA sentence, e.g. b'$GPGGA,123519,4807.038,N,...*47'
+            match: Result of _GGA_RE.match(line)
+
+        Returns:
+            Tuple of (latitude, longitude, altitude, num_satellites) or None
+            if the sentence is malformed or fails its checksum
+        """
+        body, _, checksum = line[1:].partition(b'*')
+
+        if checksum:
+            try:
+                if reduce(xor, body, 0) != int(checksum[:2], 16):
+                    return None
+            except ValueError:
+                return None
+
+        lat_field, ns, lon_field, ew, sats_field, alt_field = match.group(2, 3, 4, 5, 7, 9)
+
+        try:
+            # Latitude/longitude are ddmm.mmmm / dddmm.mmmm
+            d, m = divmod(float(lat_field), 100)
+            lat = d + m / 60
+            d, m = divmod(float(lon_field), 100)
+            lon = d + m / 60
+            alt = float(alt_field) if alt_field else None
+        except ValueError:
+            return None
+
+        if ns == b'S':
+            lat = -lat
+        if ew == b'W':
+            lon = -lon
+
+        return lat, lon, alt, int(sats_field)
+
+    @staticmethod
+    def _parse_nmea(line: bytes) -> Optional[Tuple[float, float, Optional[float], int]]:
+        """
+        Parse a GGA sentence with pynmea2 (fallback for the fast pattern)
+
+        Args:
+            line: Raw NMEA sentence
+
+        Returns:
+            Tuple of (latitude, longitude, altitude, num_satellites) or None
+            if the sentence is not a GGA fix
+        """
+        try:
+            msg = pynmea2.parse(line.decode('ascii', errors='ignore'))
+        except pynmea2.ParseError:
+            # Ignore malformed sentences
+            return None
+
+        if not isinstance(msg, pynmea2.types.talker.GGA):
+            return None
+
+        return (msg.latitude,
+                msg.longitude,
+                msg.altitude if msg.altitude else None,
+                int(msg.num_sats) if msg.num_sats else 0)
+
     def wait_for_fix(self, timeout: float = 60.0) -> Optional[GPSCoordinate]:
         """
         Wait for initial GPS fix
@@ -161,7 +247,7 @@ class GPSReader:
         logger.info(f"Waiting for GPS fix (timeout: {timeout}s)...")
         coord = self.read_position(timeout=timeout)
 
-        if coord and coord.is_valid(self.config['gps']['min_satellites']):
+        if coord and coord.is_valid(self._min_sats):
             logger.info(f"GPS fix acquired: {coord}")
             return coord
         else:
@@ -258,3 +344,21 @@ class MockGPSReader(GPSReader):
         return self.read_position()
 
 
+class NullGPSReader(GPSReader):
+    """
+    GPS reader used when GPS is disabled in configuration
+    Never connects and never reports a position
+    """
+
+    def connect(self) -> bool:
+        """GPS is disabled: nothing to connect to"""
+        logger.info("GPS is disabled in configuration")
+        return False
+
+    def read_position(self, timeout: float = 5.0) -> Optional[GPSCoordinate]:
+        """No position without GPS"""
+        return None
+
+    def wait_for_fix(self, timeout: float = 60.0) -> Optional[GPSCoordinate]:
+        """No fix without GPS"""
+        return None
@@ -18,6 +18,10 @@ from .gps_module import GPSCoordinate
 
 logger = logging.getLogger(__name__)
 
+# Seconds to keep waiting for a VFR_HUD heading once a fix is in hand; some
+# autopilots never send one
+HEADING_GRACE = 0.2
+
 
 class MAVLinkGPSReader:
     """
@@ -41,6 +45,10 @@ class MAVLinkGPSReader:
         self.mavlink_port = config['gps'].get('mavlink_port', '/dev/ttyACM0')
         self.mavlink_baud = config['gps'].get('mavlink_baud', 57600)
 
+        # Settings consulted on every received message
+        self._gps_enabled = config['gps']['enabled']
+        self._min_sats = config['gps'].get('min_satellites', 4)
+
     def connect(self) -> bool:
         """
         Connect to Pixhawk via MAVLink
@@ -48,7 +56,7 @@ class MAVLinkGPSReader:
         Returns:
             True if successful, False otherwise
         """
-        if not self.config['gps']['enabled']:
+        if not self._gps_enabled:
             logger.info("GPS is disabled in configuration")
             return False
 
@@ -107,6 +115,9 @@ class MAVLinkGPSReader:
             return self.last_valid_position
 
         try:
+            min_sats = self._min_sats
+            debug = logger.isEnabledFor(logging.DEBUG)
+
             # Wait for GPS_RAW_INT message
             start_time = time.time()
 
@@ -118,43 +129,9 @@ class MAVLinkGPSReader:
                 )
 
                 if msg:
-                    # Parse GPS data
-                    # MAVLink GPS_RAW_INT message format:
-                    # lat/lon are in 1E7 degrees (need to divide by 10,000,000)
-                    # alt is in mm (need to divide by 1000)
-                    lat = msg.lat / 1e7
-                    lon = msg.lon / 1e7
-                    alt = msg.alt / 1000.0  # Convert mm to meters
-                    sats = msg.satellites_visible
-                    fix_type = msg.fix_type
-
-                    # Check if we have a valid fix
-                    # Fix types: 0=No GPS, 1=No Fix, 2=2D Fix, 3=3D Fix
-                    if lat != 0 and lon != 0:
-                        coord = GPSCoordinate(
-                            latitude=lat,
-                            longitude=lon,
-                            altitude=alt if alt > 0 else None,
-                            num_satellites=sats,
-                            timestamp=datetime.now()
-                        )
-
-                        # Check fix quality
-                        min_sats = self.config['gps'].get('min_satellites', 4)
-
-                        if fix_type >= 2 and sats >= min_sats:
-                            # Valid fix
-                            self.last_valid_position = coord
-                            logger.debug(f"MAVLink GPS: {coord} (fix_type={fix_type})")
-                            return coord
-                        elif fix_type >= 2:
-                            # Has fix but not enough satellites
-                            logger.debug(f"GPS fix but only {sats} satellites (need {min_sats})")
-                            self.last_valid_position = coord
-                            return coord
-                        else:
-                            # No fix yet
-                            logger.debug(f"Waiting for GPS fix (fix_type={fix_type}, sats={sats})")
+                    coord = self._coord_from_gps_raw(msg, min_sats, debug)
+                    if coord is not None:
+                        return coord
 
             # Timeout reached
             logger.warning(f"GPS timeout after {timeout}s")
@@ -164,6 +141,55 @@ class MAVLinkGPSReader:
             logger.error(f"Error reading GPS from Pixhawk: {e}")
             return self.last_valid_position
 
+    def _coord_from_gps_raw(self, msg, min_sats: int, debug: bool) -> Optional[GPSCoordinate]:
+        """
+        Convert a GPS_RAW_INT message into a coordinate
+
+        Args:
+            msg: MAVLink GPS_RAW_INT message
+            min_sats: Minimum satellites for a full-quality fix
+            debug: Whether debug logging is enabled
+
+        Returns:
+            GPSCoordinate if the message carries a 2D/3D fix, None otherwise
+        """
+        # MAVLink GPS_RAW_INT message format:
+        # lat/lon are in 1E7 degrees (need to divide by 10,000,000)
+        # alt is in mm (need to divide by 1000)
+        lat = msg.lat / 1e7
+        lon = msg.lon / 1e7
+        alt = msg.alt / 1000.0  # Convert mm to meters
+        sats = msg.satellites_visible
+        fix_type = msg.fix_type
+
+        # Check if we have a valid fix
+        # Fix types: 0=No GPS, 1=No Fix, 2=2D Fix, 3=3D Fix
+        if lat == 0 or lon == 0:
+            return None
+
+        if fix_type < 2:
+            if debug:
+                logger.debug(f"Waiting for GPS fix (fix_type={fix_type}, sats={sats})")
+            return None
+
+        coord = GPSCoordinate(
+            latitude=lat,
+            longitude=lon,
+            altitude=alt if alt > 0 else None,
+            num_satellites=sats,
+            timestamp=datetime.now()
+        )
+
+        if debug:
+            if sats >= min_sats:
+                logger.debug(f"MAVLink GPS: {coord} (fix_type={fix_type})")
+            else:
+                # Has fix but not enough satellites
+                logger.debug(f"GPS fix but only {sats} satellites (need {min_sats})")
+
+        self.last_valid_position = coord
+        return coord
+
     def wait_for_fix(self, timeout: float = 60.0) -> Optional[GPSCoordinate]:
         """
         Wait for initial GPS fix
@@ -182,7 +208,7 @@ class MAVLinkGPSReader:
         while (time.time() - start_time) < timeout:
             coord = self.read_position(timeout=5)
 
-            if coord and coord.is_valid(self.config['gps'].get('min_satellites', 4)):
+            if coord and coord.is_valid(self._min_sats):
                 logger.info(f"GPS fix acquired: {coord}")
                 return coord
 
@@ -241,22 +267,59 @@ class MAVLinkGPSReaderWithCompass(MAVLinkGPSReader):
         Returns:
             GPSCoordinate with heading data
         """
-        coord = super().read_position(timeout)
+        if not self.is_connected:
+            logger.warning("Not connected to Pixhawk")
+            return self.last_valid_position
+
+        try:
+            min_sats = self._min_sats
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            # Position and heading arrive on one dispatch loop so a VFR_HUD
+            # sent while waiting for GPS_RAW_INT is not dropped
+            coord = None
+            heading = None
+            deadline = time.time() + timeout
+
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
 
-        if coord and self.is_connected:
-            # Try to get compass heading from Pixhawk
-            try:
                 msg = self.master.recv_match(
-                    type='VFR_HUD',
-                    blocking=False
+                    type=['GPS_RAW_INT', 'VFR_HUD'],
+                    blocking=True,
+                    timeout=min(1, remaining)
                 )
 
-                if msg:
+                if not msg:
+                    continue
+
+                if msg.get_type() == 'VFR_HUD':
                     heading = msg.heading  # Heading in degrees (0-360)
-                    coord.heading = heading
-                    logger.debug(f"Compass heading: {heading:.1f}°")
+                    if debug:
+                        logger.debug(f"Compass heading: {heading:.1f}°")
+                elif coord is None:
+                    coord = self._coord_from_gps_raw(msg, min_sats, debug)
+                    if coord is not None:
+                        # Don't hold the fix back for a heading the autopilot
+                        # may never send
+                        deadline = min(deadline, time.time() + HEADING_GRACE)
+                else:
+                    coord = self._coord_from_gps_raw(msg, min_sats, debug) or coord
 
-            except Exception as e:
-                logger.debug(f"Could not read compass: {e}")
+                if coord is not None and heading is not None:
+                    break
 
-        return coord
+            if coord is None:
+                logger.warning(f"GPS timeout after {timeout}s")
+                return self.last_valid_position
+
+            if heading is not None:
+                coord.heading = heading
+
+            return coord
+
+        except Exception as e:
+            logger.error(f"Error reading GPS from Pixhawk: {e}")
+            return self.last_valid_position
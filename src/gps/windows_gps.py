@@ -3,20 +3,93 @@ Windows GPS Module
 Uses Windows Location API to get GPS coordinates from laptop
 """
 
+import asyncio
+import base64
 import logging
+import math
 from typing import Optional
 from datetime import datetime
 import time
 import subprocess
+import threading
+import queue
 import json
 
+# orjson parses the helper's JSON straight from bytes, several times faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+# Native WinRT location API (preferred over the PowerShell bridge)
+try:
+    from winrt.windows.devices.geolocation import Geolocator
+    WINRT_AVAILABLE = True
+except ImportError:
+    WINRT_AVAILABLE = False
+
 from .gps_module import GPSCoordinate
 
 logger = logging.getLogger(__name__)
 
+# Line the PowerShell helper prints after each position response, followed
+# by the sequence number of the request it answers
+_END_MARKER = b'<<END>>'
+
+# Skip profile scripts, banner and prompts; the helper script is never signed
+_POWERSHELL_ARGS = ['powershell', '-NoProfile', '-NonInteractive', '-NoLogo',
+                    '-ExecutionPolicy', 'Bypass']
+
 
 class WindowsGPSReader:
-    """GPS reader for Windows laptops using PowerShell location API"""
+    """
+    GPS reader for Windows laptops
+
+    Uses the WinRT Geolocator directly when the winrt package is installed,
+    otherwise falls back to a PowerShell GeoCoordinateWatcher helper
+    """
+
+    # PowerShell helper: one GeoCoordinateWatcher for the whole session
+    # (woken by StatusChanged rather than polled until Ready),
+    # answering each "get <seq>" line on stdin with a JSON position
+    _POWERSHELL_SCRIPT = '''
+Add-Type -AssemblyName System.Device
+$watcher = New-Object System.Device.Location.GeoCoordinateWatcher
+Register-ObjectEvent -InputObject $watcher -EventName StatusChanged -SourceIdentifier GPSStatus | Out-Null
+$watcher.Start()
+$deadline = (Get-Date).AddSeconds(30)
+while ($watcher.Status -ne 'Ready') {
+    $remaining = [int][Math]::Ceiling(($deadline - (Get-Date)).TotalSeconds)
+    if ($remaining -le 0) { break }
+    $evt = Wait-Event -SourceIdentifier GPSStatus -Timeout $remaining
+    if ($evt) { $evt | Remove-Event }
+}
+Unregister-Event -SourceIdentifier GPSStatus
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if (($line -eq $null) -or ($line -eq 'q')) { break }
+    $seq = $line.Substring([Math]::Min(4, $line.Length))
+    if ($watcher.Status -eq 'Ready') {
+        $coord = $watcher.Position.Location
+        @{
+            latitude = $coord.Latitude
+            longitude = $coord.Longitude
+            altitude = $coord.Altitude
+        } | ConvertTo-Json -Compress
+    } else {
+        @{ error = "Location not available" } | ConvertTo-Json -Compress
+    }
+    [Console]::Out.WriteLine('<<END>> ' + $seq)
+    [Console]::Out.Flush()
+}
+$watcher.Stop()
+'''
+
+    # -EncodedCommand takes base64 UTF-16LE, so no shell quoting is involved
+    _ENCODED_SCRIPT = base64.b64encode(_POWERSHELL_SCRIPT.encode('utf-16-le')).decode('ascii')
 
     def __init__(self, config: dict):
         """
@@ -28,7 +101,25 @@ class WindowsGPSReader:
         self.config = config
         self.is_connected = False
         self.last_valid_position: Optional[GPSCoordinate] = None
-        self._powershell_script = None
+
+        # Long-lived PowerShell helper and the queue its stdout is pumped into
+        self._ps_proc: Optional[subprocess.Popen] = None
+        self._ps_lines: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        # Number of the latest request; replies to earlier (timed-out) ones are skipped
+        self._ps_seq = 0
+
+        # Location services update at ~1 Hz; reads closer together than this reuse the last fix
+        self._cache_ttl = config['gps'].get('cache_ttl_s', 0.5)
+        self._last_read_ts = 0.0
+
+        # Optional background polling (see start_streaming)
+        self._stream_interval = config['gps'].get('stream_interval_s', 1.0)
+        self._stream_thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # WinRT backend: Geolocator plus the event loop its async calls run on
+        self._locator = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def connect(self) -> bool:
         """
@@ -47,38 +138,130 @@ class WindowsGPSReader:
             logger.info("  Settings > Privacy & security > Location > Location services: ON")
             logger.info("  Allow apps to access your location: ON")
 
-            # Create PowerShell script to access location
-            self._powershell_script = '''
-Add-Type -AssemblyName System.Device
-$watcher = New-Object System.Device.Location.GeoCoordinateWatcher
-$watcher.Start()
-$timeout = 30
-$counter = 0
-while (($watcher.Status -ne 'Ready') -and ($counter -lt $timeout)) {
-    Start-Sleep -Milliseconds 100
-    $counter += 0.1
-}
-if ($watcher.Status -eq 'Ready') {
-    $coord = $watcher.Position.Location
-    @{
-        latitude = $coord.Latitude
-        longitude = $coord.Longitude
-        altitude = $coord.Altitude
-    } | ConvertTo-Json
-} else {
-    Write-Error "Location not available"
-}
-$watcher.Stop()
-'''
+            if WINRT_AVAILABLE:
+                self._locator = Geolocator()
+                self._loop = asyncio.new_event_loop()
+                logger.info("Using WinRT Geolocator")
+                self.is_connected = True
+                return True
+
+            logger.info("winrt not installed, using PowerShell location helper "
+                        "(pip install winrt-Windows.Devices.Geolocation for the native API)")
+
+            self._ps_proc = subprocess.Popen(
+                _POWERSHELL_ARGS + ['-EncodedCommand', self._ENCODED_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT
+            )
+
+            # Pump stdout on a daemon thread so reads can time out on any platform
+            threading.Thread(target=self._pump_output, args=(self._ps_proc.stdout,),
+                             daemon=True).start()
 
             self.is_connected = True
             return True
 
         except Exception as e:
-            logger.error(f"Failed to connect to Windows GPS: {e}")
+            logger.error("Failed to connect to Windows GPS: %s", e)
             self.is_connected = False
             return False
 
+    def _pump_output(self, stream):
+        """
+        Forward PowerShell helper output lines to the read queue
+
+        Args:
+            stream: Helper process stdout
+        """
+        for line in stream:
+            self._ps_lines.put(line.strip())
+        # EOF: helper exited
+        self._ps_lines.put(None)
+
+    def _request_position(self, timeout: float) -> bytes:
+        """
+        Ask the PowerShell helper for the current position
+
+        Args:
+            timeout: Maximum time to wait for the response (seconds)
+
+        Returns:
+            Response payload (single line of UTF-8 JSON)
+
+        Raises:
+            subprocess.TimeoutExpired: No complete response within timeout
+            RuntimeError: Helper process has exited
+        """
+        self._ps_seq += 1
+        seq = str(self._ps_seq).encode('ascii')
+        self._ps_proc.stdin.write(b"get " + seq + b"\n")
+        self._ps_proc.stdin.flush()
+
+        deadline = time.monotonic() + timeout
+        payload = []
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired('powershell', timeout)
+
+            try:
+                line = self._ps_lines.get(timeout=remaining)
+            except queue.Empty:
+                raise subprocess.TimeoutExpired('powershell', timeout)
+
+            if line is None:
+                raise RuntimeError("PowerShell location helper exited")
+            if line.startswith(_END_MARKER):
+                if line[len(_END_MARKER):].strip() == seq:
+                    break
+                # Late reply to an earlier request that timed out
+                payload = []
+                continue
+            if line:
+                payload.append(line)
+
+        # stderr is merged into stdout: anything before the JSON line is diagnostics
+        for extra in payload[:-1]:
+            logger.warning("PowerShell: %s", extra.decode(errors='replace'))
+
+        return payload[-1] if payload else b''
+
+    def _read_winrt(self, timeout: float) -> Optional[GPSCoordinate]:
+        """
+        Read the current position from the WinRT Geolocator
+
+        Args:
+            timeout: Maximum time to wait for a position (seconds)
+
+        Returns:
+            GPSCoordinate object or None if no position is available
+        """
+        position = self._loop.run_until_complete(
+            asyncio.wait_for(self._locator.get_geoposition_async(), timeout)
+        )
+        point = position.coordinate.point.position
+
+        if point.latitude == 0 and point.longitude == 0:
+            return None
+
+        return GPSCoordinate(
+            latitude=point.latitude,
+            longitude=point.longitude,
+            altitude=point.altitude or None,
+            num_satellites=8,  # Windows doesn't provide this
+            timestamp=datetime.now()
+        )
+
+    @staticmethod
+    def _to_float(value) -> float:
+        """Convert a JSON location field to float, NaN if missing or malformed"""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return math.nan
+
     def read_position(self, timeout: float = 5.0) -> Optional[GPSCoordinate]:
         """
         Read current GPS position from Windows
@@ -93,47 +276,80 @@ $watcher.Stop()
             logger.warning("GPS not connected")
             return self.last_valid_position
 
-        try:
-            # Run PowerShell script to get location
-            result = subprocess.run(
-                ['powershell', '-Command', self._powershell_script],
-                capture_output=True,
-                text=True,
-                timeout=timeout + 5
-            )
+        # Background stream keeps the position current; just hand it out
+        if self._stream_thread is not None:
+            return self.last_valid_position
+
+        now = time.monotonic()
+        if self.last_valid_position is not None and (now - self._last_read_ts) < self._cache_ttl:
+            return self.last_valid_position
+
+        return self._read_raw(timeout)
 
-            if result.returncode == 0 and result.stdout.strip():
-                data = json.loads(result.stdout.strip())
+    def _read_raw(self, timeout: float) -> Optional[GPSCoordinate]:
+        """
+        Query location services for a fresh position
+
+        Args:
+            timeout: Maximum time to wait for valid GPS data (seconds)
+
+        Returns:
+            New GPSCoordinate, or the last valid position if the read failed
+        """
+        now = time.monotonic()
+
+        if self._locator is not None:
+            try:
+                coord = self._read_winrt(timeout)
+            except asyncio.TimeoutError:
+                logger.warning("GPS timeout after %ss", timeout)
+                return self.last_valid_position
+            except Exception as e:
+                # Access denied / location services off surface as OSError
+                logger.error("Error reading Windows GPS: %s", e)
+                logger.error("Check: Settings > Privacy > Location")
+                return self.last_valid_position
 
-                lat = data.get('latitude')
-                lon = data.get('longitude')
-                alt = data.get('altitude')
+            if coord is None:
+                logger.warning("Windows returned invalid coordinates (0,0)")
+                return self.last_valid_position
 
-                # Check if coordinates are valid (not NaN)
-                if lat and lon and not (lat == 0 and lon == 0):
-                    # Handle NaN altitude
-                    if alt and str(alt).lower() != 'nan':
-                        altitude = float(alt)
-                    else:
-                        altitude = None
+            self.last_valid_position = coord
+            self._last_read_ts = now
+            logger.debug("Windows GPS fix: %s", coord)
+            return coord
 
+        try:
+            # Ask the running PowerShell helper for its latest position
+            output = self._request_position(timeout + 5)
+            data = _json_loads(output)
+
+            if 'error' not in data:
+                # ConvertTo-Json writes unknown values as "NaN"; coerce once
+                lat = self._to_float(data.get('latitude'))
+                lon = self._to_float(data.get('longitude'))
+                alt = self._to_float(data.get('altitude'))
+
+                # Check if coordinates are valid (not NaN, not 0,0)
+                if not (math.isnan(lat) or math.isnan(lon) or (lat == 0.0 and lon == 0.0)):
                     coord = GPSCoordinate(
-                        latitude=float(lat),
-                        longitude=float(lon),
-                        altitude=altitude,
+                        latitude=lat,
+                        longitude=lon,
+                        altitude=None if math.isnan(alt) or alt == 0.0 else alt,
                         num_satellites=8,  # Windows doesn't provide this
                         timestamp=datetime.now()
                     )
 
                     self.last_valid_position = coord
-                    logger.debug(f"Windows GPS fix: {coord}")
+                    self._last_read_ts = now
+                    logger.debug("Windows GPS fix: %s", coord)
                     return coord
                 else:
                     logger.warning("Windows returned invalid coordinates (0,0) or NaN")
                     return self.last_valid_position
             else:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error"
-                logger.warning(f"Failed to get Windows location: {error_msg}")
+                error_msg = data['error']
+                logger.warning("Failed to get Windows location: %s", error_msg)
 
                 if "Location not available" in error_msg:
                     logger.error("Location Services may be disabled or no location providers available")
@@ -142,13 +358,13 @@ $watcher.Stop()
                 return self.last_valid_position
 
         except subprocess.TimeoutExpired:
-            logger.warning(f"GPS timeout after {timeout}s")
+            logger.warning("GPS timeout after %ss", timeout)
             return self.last_valid_position
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse location data: {e}")
+        except JSONDecodeError as e:
+            logger.error("Failed to parse location data: %s", e)
             return self.last_valid_position
         except Exception as e:
-            logger.error(f"Error reading Windows GPS: {e}")
+            logger.error("Error reading Windows GPS: %s", e)
             return self.last_valid_position
 
     def wait_for_fix(self, timeout: float = 60.0) -> Optional[GPSCoordinate]:
@@ -161,19 +377,54 @@ $watcher.Stop()
         Returns:
             GPSCoordinate or None if timeout
         """
-        logger.info(f"Waiting for Windows GPS fix (timeout: {timeout}s)...")
+        logger.info("Waiting for Windows GPS fix (timeout: %ss)...", timeout)
         logger.info("Make sure Location Services are enabled in Windows Settings")
 
         coord = self.read_position(timeout=timeout)
 
         if coord and coord.is_valid(min_satellites=1):  # Windows GPS always "valid" if we get coords
-            logger.info(f"GPS fix acquired: {coord}")
+            logger.info("GPS fix acquired: %s", coord)
             return coord
         else:
             logger.warning("Failed to acquire GPS fix from Windows")
             logger.warning("Check: Settings > Privacy > Location")
             return None
 
+    def start_streaming(self):
+        """
+        Poll location services on a background thread
+
+        After this, read_position returns the latest streamed position
+        immediately instead of waiting on location services.
+        """
+        if not self.is_connected or self._stream_thread is not None:
+            return
+
+        self._running = True
+        self._stream_thread = threading.Thread(target=self._stream_loop, daemon=True)
+        self._stream_thread.start()
+        logger.info("Streaming Windows GPS every %ss", self._stream_interval)
+
+    def _stream_loop(self):
+        """Background loop refreshing last_valid_position"""
+        while self._running:
+            self._read_raw(timeout=self._stream_interval + 5)
+            time.sleep(self._stream_interval)
+
+    def stop_streaming(self):
+        """Stop the background polling thread"""
+        thread = self._stream_thread
+        if thread is None:
+            return
+
+        self._running = False
+        thread.join(timeout=self._stream_interval + 10)
+        self._stream_thread = None
+
+    def invalidate(self):
+        """Force the next read_position call to query location services"""
+        self._last_read_ts = 0.0
+
     def get_last_position(self) -> Optional[GPSCoordinate]:
         """
         Get last known valid position
@@ -185,6 +436,23 @@ $watcher.Stop()
 
     def disconnect(self):
         """Disconnect from Windows GPS"""
+        self.stop_streaming()
+
+        if self._ps_proc is not None:
+            try:
+                self._ps_proc.stdin.write(b"q\n")
+                self._ps_proc.stdin.flush()
+                self._ps_proc.wait(timeout=5)
+            except Exception:
+                # Broken pipe or helper not responding
+                self._ps_proc.kill()
+            self._ps_proc = None
+
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+        self._locator = None
+
         logger.info("Windows GPS disconnected")
         self.is_connected = False
 
@@ -3,21 +3,31 @@ Cell Signal Mapper - Main Application
 Drone-based cellular signal strength mapping system
 """
 
-import yaml
+import atexit
+import copy
+import os
+import pickle
 import logging
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 import sys
 import time
+import queue
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
 
 import platform
 
-from scanner import RTLScannerCLI
-from gps import GPSReader, MockGPSReader, WindowsGPSReader, MAVLinkGPSReader, MAVLINK_AVAILABLE
-from utils import DataLogger
-from exporter import KMLExporter
-from visualization import InteractiveHeatmapGenerator
+# Platform doesn't change during a run
+_SYSTEM = platform.system()
+
+# Project modules pull in NumPy/pandas/SciPy/folium, so they are imported
+# inside the modes that use them; --help and argument errors stay instant
+if TYPE_CHECKING:
+    from utils import DataLogger
 
 
 def setup_logging(config: dict) -> None:
@@ -38,10 +48,12 @@ def setup_logging(config: dict) -> None:
 
     if config['logging']['log_to_file']:
         log_dir = Path(config['logging']['log_dir'])
-        log_dir.mkdir(parents=True, exist_ok=True)
+        if not log_dir.is_dir():
+            log_dir.mkdir(parents=True, exist_ok=True)
 
         log_file = log_dir / f"signal_mapper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        file_handler = logging.FileHandler(log_file)
+        # delay: the file is only created once the first record is written
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -58,6 +70,61 @@ def setup_logging(config: dict) -> None:
     logging.info(f"Logging initialized (level: {config['logging']['log_level']})")
 
 
+class _ConfigUnpickler(pickle.Unpickler):
+    """Unpickler for the config sidecar: plain containers and scalars only"""
+
+    def find_class(self, module, name):
+        # Refusing every global means loading can never import or call anything
+        raise pickle.UnpicklingError(f"config cache may not reference {module}.{name}")
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, stamp: tuple) -> dict:
+    """
+    Parse a YAML config file (cached per path and (mtime_ns, size))
+
+    The parsed result is also pickled next to the YAML file so later runs
+    skip parsing until the config changes. The sidecar records the stamp of
+    the YAML it was made from and is only used on an exact match.
+    """
+    cache_path = Path(path + '.pkl')
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = _ConfigUnpickler(f).load()
+        if isinstance(cached, dict) and cached.get('source') == stamp:
+            return cached['config']
+    except Exception:
+        # The sidecar only saves time: any unreadable or corrupt file means reparse
+        pass
+
+    import yaml
+    # LibYAML's C parser when PyYAML was built against it
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    # Write then rename, so an interrupted or concurrent run never leaves a
+    # partial sidecar; the temp name is per process
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'source': stamp, 'config': config}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        # Read-only config directory or an unpicklable value: just parse every run
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return config
+
+
 def load_config(config_path: str = "config/config.yaml") -> dict:
     """Load configuration from YAML file"""
     config_file = Path(config_path)
@@ -65,10 +132,10 @@ def load_config(config_path: str = "config/config.yaml") -> dict:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
-
-    return config
+    # Reparse only when the file changes; hand out a copy callers may modify
+    stat = config_file.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(_load_config_cached(str(config_file.resolve()), stamp))
 
 
 def get_gps_reader(config: dict, use_mock_gps: bool = False):
@@ -82,8 +149,14 @@ def get_gps_reader(config: dict, use_mock_gps: bool = False):
     Returns:
         GPS reader instance
     """
+    from gps import GPSReader, MockGPSReader, NullGPSReader, WindowsGPSReader, MAVLinkGPSReader, MAVLINK_AVAILABLE
+
     logger = logging.getLogger(__name__)
 
+    if not config['gps']['enabled']:
+        # Don't construct a hardware/OS backend that will never be connected
+        return NullGPSReader(config)
+
     if use_mock_gps:
         logger.info("Using mock GPS (simulated data)")
         return MockGPSReader(config)
@@ -107,7 +180,7 @@ def get_gps_reader(config: dict, use_mock_gps: bool = False):
 
     elif gps_source == 'serial':
         # Use serial GPS (direct GPS module connection)
-        if platform.system() == 'Windows':
+        if _SYSTEM == 'Windows':
             logger.info("Using Windows GPS (WiFi location)")
             return WindowsGPSReader(config)
         else:
@@ -116,12 +189,55 @@ def get_gps_reader(config: dict, use_mock_gps: bool = False):
 
     else:
         logger.warning(f"Unknown GPS source '{gps_source}', falling back to serial")
-        if platform.system() == 'Windows':
+        if _SYSTEM == 'Windows':
             return WindowsGPSReader(config)
         else:
             return GPSReader(config)
 
 
+# Continuous mode: pause between GPS reads, and scans allowed to queue for logging
+GPS_POLL_INTERVAL = 0.2
+RESULTS_QUEUE_SIZE = 64
+
+# (config, use_mock_gps, reader) shared by every scan in this process
+_cached_gps_reader = None
+
+
+def get_cached_gps_reader(config: dict, use_mock_gps: bool = False):
+    """
+    Get a GPS reader that stays connected across scans
+
+    Repeated scans with the same config reuse one reader (and its warmed-up
+    fix) instead of reconnecting each time. The reader is disconnected at exit.
+
+    Args:
+        config: Configuration dictionary
+        use_mock_gps: Use simulated GPS data
+
+    Returns:
+        GPS reader instance
+    """
+    global _cached_gps_reader
+
+    cached = _cached_gps_reader
+    if cached is not None and cached[0] is config and cached[1] == use_mock_gps:
+        return cached[2]
+
+    if cached is not None:
+        cached[2].disconnect()
+
+    reader = get_gps_reader(config, use_mock_gps)
+    _cached_gps_reader = (config, use_mock_gps, reader)
+    return reader
+
+
+@atexit.register
+def _disconnect_cached_gps_reader():
+    """Release the shared GPS reader on interpreter exit"""
+    if _cached_gps_reader is not None:
+        _cached_gps_reader[2].disconnect()
+
+
 def get_scanner(config: dict):
     """
     Get RTL-SDR scanner instance
@@ -132,9 +248,44 @@ def get_scanner(config: dict):
     Returns:
         Scanner instance
     """
+    from scanner import RTLScannerCLI
+
     return RTLScannerCLI(config)
 
 
+def format_scan_summary(scan_results: dict) -> str:
+    """
+    Format per-band scan results as one multi-line summary
+
+    Args:
+        scan_results: Results from scanner.scan_lte_bands, keyed by band name
+
+    Returns:
+        Summary text (one block per band that returned results)
+    """
+    return "\n".join(
+        f"{band_name}:\n"
+        f"  Average Power: {results.get('average_power_dbm', 0):.2f} dBm\n"
+        f"  Max Power: {results.get('max_power_dbm', 0):.2f} dBm at {results.get('frequency_mhz', 0):.2f} MHz\n"
+        f"  Scanned {results.get('num_samples', 0)} frequency points"
+        for band_name, results in scan_results.items()
+        if results and isinstance(results, dict)
+    )
+
+
+def log_scan_summary(logger: logging.Logger, scan_results: dict, level: int = logging.INFO):
+    """
+    Log the per-band scan summary, formatting it only if the level is enabled
+
+    Args:
+        logger: Logger to write to
+        scan_results: Results from scanner.scan_lte_bands, keyed by band name
+        level: Logging level for the summary
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, "\n=== Scan Results ===\n" + format_scan_summary(scan_results))
+
+
 def single_scan_mode(config: dict, use_mock_gps: bool = False):
     """
     Perform a single scan at current location
@@ -143,84 +294,170 @@ def single_scan_mode(config: dict, use_mock_gps: bool = False):
         config: Configuration dictionary
         use_mock_gps: Use simulated GPS data
     """
+    from concurrent.futures import ThreadPoolExecutor
+    from utils import DataLogger
+
     logger = logging.getLogger(__name__)
     logger.info("=== Starting Single Scan Mode ===")
 
     # Initialize components
     scanner = get_scanner(config)
-    gps_reader = get_gps_reader(config, use_mock_gps)
+    gps_reader = get_cached_gps_reader(config, use_mock_gps)
     data_logger = DataLogger(config)
 
+    # Settings consulted during the run, looked up once
+    bands = config['bands']
+    gps_enabled = config['gps']['enabled']
+    export_cfg = config['export']
+
     try:
         # Initialize RTL-SDR
         if not scanner.initialize():
             logger.error("Failed to initialize RTL-SDR")
             return
 
-        # Connect GPS
-        if config['gps']['enabled']:
+        # Connect GPS (a reader kept from an earlier scan is already warmed up)
+        if gps_enabled and not gps_reader.is_connected:
             if not gps_reader.connect():
                 logger.warning("GPS connection failed, proceeding without GPS")
             else:
                 logger.info("Waiting for GPS fix...")
                 gps_reader.wait_for_fix(timeout=90)
 
-        # Get current position
-        gps_coord = gps_reader.read_position() if gps_reader.is_connected else None
+        # Perform scan in the background: rtl_power spends its integration
+        # time blocked on the dongle, so the GPS read overlaps with it
+        logger.info("Starting signal scan...")
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='rtl-scan') as pool:
+            scan_future = pool.submit(scanner.scan_lte_bands, bands)
 
-        if gps_coord:
-            logger.info(f"GPS Position: {gps_coord}")
-            lat, lon, alt = gps_coord.latitude, gps_coord.longitude, gps_coord.altitude
-        else:
-            logger.warning("No GPS fix available")
-            lat, lon, alt = None, None, None
+            # Get current position
+            gps_coord = gps_reader.read_position() if gps_reader.is_connected else None
 
-        # Perform scan
-        logger.info("Starting signal scan...")
-        scan_results = scanner.scan_lte_bands(config['bands'])
+            if gps_coord:
+                logger.info("GPS Position: %s", gps_coord)
+                lat, lon, alt = gps_coord.latitude, gps_coord.longitude, gps_coord.altitude
+            else:
+                logger.warning("No GPS fix available")
+                lat, lon, alt = None, None, None
+
+            scan_results = scan_future.result()
 
         # Log results
-        timestamp = datetime.now()
-        data_logger.log_scan_results(lat, lon, alt, scan_results, timestamp)
+        data_logger.log_scan_results(lat, lon, alt, scan_results, time.time_ns())
 
         # Display results
-        logger.info("\n=== Scan Results ===")
-        for band_name, results in scan_results.items():
-            if results and isinstance(results, dict):
-                logger.info(f"{band_name}:")
-                logger.info(f"  Average Power: {results.get('average_power_dbm', 0):.2f} dBm")
-                logger.info(f"  Max Power: {results.get('max_power_dbm', 0):.2f} dBm at {results.get('frequency_mhz', 0):.2f} MHz")
-                logger.info(f"  Scanned {results.get('num_samples', 0)} frequency points")
+        log_scan_summary(logger, scan_results)
 
         # Save data
         logger.info("\n=== Saving Data ===")
-        if config['export']['csv_enabled']:
+        if export_cfg['csv_enabled']:
             csv_path = data_logger.save_to_csv()
-            logger.info(f"CSV: {csv_path}")
+            logger.info("CSV: %s", csv_path)
 
-        if config['export']['json_enabled']:
+        if export_cfg['json_enabled']:
             json_path = data_logger.save_to_json()
-            logger.info(f"JSON: {json_path}")
+            logger.info("JSON: %s", json_path)
+
+        if export_cfg.get('parquet_enabled', False):
+            parquet_path = data_logger.save_to_parquet()
+            if parquet_path:
+                logger.info("Parquet: %s", parquet_path)
 
         # Generate visualizations
         if len(data_logger) > 0:
             df = data_logger.get_dataframe()
+            has_geo = not df.empty and df['latitude'].count() > 0
 
-            if config['export']['kml_enabled'] and df['latitude'].notna().any():
+            if export_cfg['kml_enabled'] and has_geo:
                 logger.info("Generating KML export...")
+                from exporter import KMLExporter
                 kml_exporter = KMLExporter(config)
                 kml_path = kml_exporter.export_to_kml(df)
-                logger.info(f"KML: {kml_path}")
+                logger.info("KML: %s", kml_path)
 
         logger.info("\n=== Single Scan Complete ===")
 
     except KeyboardInterrupt:
         logger.info("Scan interrupted by user")
     except Exception as e:
-        logger.error(f"Error during scan: {e}", exc_info=True)
+        logger.error("Error during scan: %s", e, exc_info=True)
     finally:
+        # GPS reader stays connected for later scans; released at exit
         scanner.close()
-        gps_reader.disconnect()
+        data_logger.close()
+
+
+def _gps_producer(gps_reader, latest_fix: deque, stop_event: threading.Event,
+                  poll_interval: float = GPS_POLL_INTERVAL):
+    """
+    Keep the freshest GPS fixes in a small buffer until stopped
+
+    Args:
+        gps_reader: Connected GPS reader
+        latest_fix: deque(maxlen=2) that (monotonic time, GPSCoordinate) pairs are pushed into
+        stop_event: Set to end the loop
+        poll_interval: Pause between reads (some readers return immediately)
+    """
+    while not stop_event.is_set():
+        # 1.0s timeout matches Pixhawk GPS update rate
+        coord = gps_reader.read_position(timeout=1.0)
+        # Readers hand back their last fix on timeout; that is not a new sample
+        if coord and not (latest_fix and latest_fix[-1][1] is coord):
+            latest_fix.append((time.monotonic(), coord))
+        stop_event.wait(poll_interval)
+
+
+def _position_at(latest_fix: deque, when: float, extrapolate: bool) -> tuple:
+    """
+    Position to tag a scan taken at a given time
+
+    Args:
+        latest_fix: Buffer filled by _gps_producer
+        when: Monotonic time of the scan
+        extrapolate: Project along the last two fixes instead of reusing the newest one
+
+    Returns:
+        (lat, lon, alt), all None without a fix
+    """
+    # One C-level copy, so the producer can't append halfway through
+    fixes = tuple(latest_fix)
+    if not fixes:
+        return None, None, None
+
+    t1, newest = fixes[-1]
+    if extrapolate and len(fixes) == 2:
+        t0, previous = fixes[0]
+        span = t1 - t0
+        if span > 0:
+            # Same velocity as the last leg, never more than one fix interval ahead
+            f = min(max(when - t1, 0.0), span) / span
+            return (newest.latitude + (newest.latitude - previous.latitude) * f,
+                    newest.longitude + (newest.longitude - previous.longitude) * f,
+                    newest.altitude)
+
+    return newest.latitude, newest.longitude, newest.altitude
+
+
+def _results_consumer(data_logger: 'DataLogger', results_queue: queue.Queue, logger: logging.Logger):
+    """
+    Record scan results from the queue until a None sentinel arrives
+
+    Args:
+        data_logger: Logger the measurements are stored in
+        results_queue: Queue of (lat, lon, alt, scan_results, timestamp_ns) tuples
+        logger: Application logger for the per-scan debug summary
+    """
+    while True:
+        item = results_queue.get()
+        if item is None:
+            return
+
+        lat, lon, alt, scan_results, timestamp = item
+        try:
+            data_logger.log_scan_results(lat, lon, alt, scan_results, timestamp)
+        except Exception as e:
+            logger.error("Failed to log scan results: %s", e)
+        log_scan_summary(logger, scan_results, logging.DEBUG)
 
 
 def continuous_scan_mode(config: dict, interval: float = 0.5, use_mock_gps: bool = False, duration_minutes: float = 15.0):
@@ -233,18 +470,37 @@ def continuous_scan_mode(config: dict, interval: float = 0.5, use_mock_gps: bool
         use_mock_gps: Use simulated GPS data
         duration_minutes: Auto-stop after this many minutes (default 15.0 for typical flight time)
     """
+    from gps import WindowsGPSReader
+    from utils import DataLogger
+
     logger = logging.getLogger(__name__)
     logger.info("=== Starting Continuous Scan Mode (Manual Flight) ===")
-    logger.info(f"Scan interval: {interval}s")
-    logger.info(f"Flight duration: {duration_minutes} minutes (auto-stop)")
+    logger.info("Scan interval: %ss", interval)
+    logger.info("Flight duration: %s minutes (auto-stop)", duration_minutes)
     logger.info("Optimized for rapid data collection during flight")
     logger.info("Press Ctrl+C to stop early and save data")
 
     # Initialize components
     scanner = get_scanner(config)
-    gps_reader = get_gps_reader(config, use_mock_gps)
+    gps_reader = get_cached_gps_reader(config, use_mock_gps)
     data_logger = DataLogger(config)
 
+    # Settings consulted during the run, looked up once
+    bands = config['bands']
+    gps_enabled = config['gps']['enabled']
+    export_cfg = config['export']
+    extrapolate_fixes = config['gps'].get('extrapolate_fixes', False)
+
+    # Pipeline: a GPS thread keeps the freshest fix, this thread runs the
+    # RTL-SDR sweeps, and a logger thread records results
+    stop_event = threading.Event()
+    latest_fix = deque(maxlen=2)
+    results_queue = queue.Queue(maxsize=RESULTS_QUEUE_SIZE)
+    gps_thread = threading.Thread(target=_gps_producer, args=(gps_reader, latest_fix, stop_event),
+                                  name='gps-producer', daemon=True)
+    log_thread = threading.Thread(target=_results_consumer, args=(data_logger, results_queue, logger),
+                                  name='scan-logger', daemon=True)
+
     try:
         # Initialize RTL-SDR
         logger.info("Initializing RTL-SDR...")
@@ -252,109 +508,146 @@ def continuous_scan_mode(config: dict, interval: float = 0.5, use_mock_gps: bool
             logger.error("Failed to initialize RTL-SDR")
             return
 
-        # Connect GPS
-        if config['gps']['enabled']:
+        # Connect GPS (a reader kept from an earlier scan is already warmed up)
+        if gps_enabled and not gps_reader.is_connected:
             logger.info("Connecting to GPS...")
             if gps_reader.connect():
                 logger.info("Waiting for GPS fix (GO OUTSIDE if indoors)...")
                 gps_reader.wait_for_fix(timeout=90)
+                if isinstance(gps_reader, WindowsGPSReader):
+                    # Keep location polling off the scan loop's critical path
+                    gps_reader.start_streaming()
                 logger.info("GPS ready!")
             else:
                 logger.warning("GPS connection failed - will proceed without coordinates")
 
+        if gps_reader.is_connected:
+            # Seed with the fix from connect so the first scans are tagged too
+            last_fix = gps_reader.get_last_position()
+            if last_fix:
+                latest_fix.append((time.monotonic(), last_fix))
+            gps_thread.start()
+        log_thread.start()
+
         logger.info("\n✓ System ready! Starting data collection...")
         logger.info("=" * 60)
 
         scan_count = 0
-        start_time = time.time()
         duration_seconds = duration_minutes * 60
 
+        # Wall time is read once; everything after is derived from the monotonic clock
+        session_start = datetime.now()
+        start_time = time.monotonic()
+        session_start_ns = time.time_ns()
+        start_ns = time.monotonic_ns()
+
         # Calculate expected end time
-        end_time = start_time + duration_seconds
-        end_time_str = datetime.fromtimestamp(end_time).strftime('%H:%M:%S')
-        logger.info(f"Collection will auto-stop at: {end_time_str} (in {duration_minutes} min)")
+        end_time_str = (session_start + timedelta(seconds=duration_seconds)).strftime('%H:%M:%S')
+        logger.info("Collection will auto-stop at: %s (in %s min)", end_time_str, duration_minutes)
+
+        # Progress lines are skipped entirely when INFO is filtered out
+        progress_enabled = logger.isEnabledFor(logging.INFO)
+
+        # Bound methods used every iteration, resolved once
+        scan = scanner.scan_lte_bands
+        publish = results_queue.put
+        wait = stop_event.wait
+        monotonic = time.monotonic
+        monotonic_ns = time.monotonic_ns
 
         while True:
             # Check if duration elapsed
-            elapsed = time.time() - start_time
+            elapsed = monotonic() - start_time
             if elapsed >= duration_seconds:
-                logger.info(f"\n⏱️  Flight duration of {duration_minutes} minutes reached")
+                logger.info("\n⏱️  Flight duration of %s minutes reached", duration_minutes)
                 logger.info("Auto-stopping data collection...")
                 break
 
             scan_count += 1
 
-            # Get current position (1.0s timeout matches Pixhawk GPS update rate)
-            gps_coord = gps_reader.read_position(timeout=1.0) if gps_reader.is_connected else None
-
-            if gps_coord:
-                lat, lon, alt = gps_coord.latitude, gps_coord.longitude, gps_coord.altitude
-            else:
-                lat, lon, alt = None, None, None
-
             # Perform scan
-            scan_results = scanner.scan_lte_bands(config['bands'])
+            scan_results = scan(bands)
 
-            # Log results
-            timestamp = datetime.now()
-            data_logger.log_scan_results(lat, lon, alt, scan_results, timestamp)
+            # Tag with the freshest fixes the GPS thread has published
+            timestamp = session_start_ns + (monotonic_ns() - start_ns)
+            lat, lon, alt = _position_at(latest_fix, monotonic(), extrapolate_fixes)
+
+            # Hand off to the logger thread; the next sweep starts right away
+            publish((lat, lon, alt, scan_results, timestamp))
 
             # Display lightweight progress (every 10 scans to reduce clutter)
-            if scan_count % 10 == 0:
+            if scan_count % 10 == 0 and progress_enabled:
                 remaining_seconds = duration_seconds - elapsed
                 remaining_minutes = remaining_seconds / 60
                 rate = scan_count / elapsed if elapsed > 0 else 0
-                logger.info(f"Scan #{scan_count} | {len(data_logger)} measurements | {rate:.1f} scans/sec | {remaining_minutes:.1f} min remaining")
+                logger.info("Scan #%s | %s measurements | %.1f scans/sec | %.1f min remaining", scan_count, len(data_logger), rate, remaining_minutes)
 
-            # Wait for next scan
-            time.sleep(interval)
+            # Wait for next scan, scheduled from the session start so slow
+            # scans don't push every later one back
+            next_tick = start_time + scan_count * interval
+            wait(max(0.0, next_tick - monotonic()))
 
     except KeyboardInterrupt:
         logger.info("\n=== Continuous scan stopped by user (early) ===")
     except Exception as e:
-        logger.error(f"Error during continuous scan: {e}", exc_info=True)
+        logger.error("Error during continuous scan: %s", e, exc_info=True)
     finally:
+        # Drain the pipeline so every completed scan is logged before saving
+        stop_event.set()
+        if log_thread.is_alive():
+            results_queue.put(None)
+            log_thread.join()
+        if gps_thread.is_alive():
+            gps_thread.join(timeout=5)
+
         # Save all collected data (runs whether auto-stopped, manually stopped, or error)
         logger.info("\nSaving data...")
 
-        if config['export']['csv_enabled']:
+        if export_cfg['csv_enabled']:
             csv_path = data_logger.save_to_csv()
-            logger.info(f"CSV: {csv_path}")
+            logger.info("CSV: %s", csv_path)
 
-        if config['export']['json_enabled']:
+        if export_cfg['json_enabled']:
             json_path = data_logger.save_to_json()
-            logger.info(f"JSON: {json_path}")
+            logger.info("JSON: %s", json_path)
+
+        if export_cfg.get('parquet_enabled', False):
+            parquet_path = data_logger.save_to_parquet()
+            if parquet_path:
+                logger.info("Parquet: %s", parquet_path)
 
         # Generate visualizations
         if len(data_logger) > 0:
             df = data_logger.get_dataframe()
+            has_geo = not df.empty and df['latitude'].count() > 0
 
             # KML export (for Google Earth)
-            if config['export']['kml_enabled'] and df['latitude'].notna().any():
+            if export_cfg['kml_enabled'] and has_geo:
                 logger.info("Generating KML exports...")
+                from exporter import KMLExporter
                 kml_exporter = KMLExporter(config)
                 # Use session_id for unique filename
                 kml_filename = f"signal_map_{data_logger.session_id}.kml"
                 kml_path = kml_exporter.export_to_kml(df, output_filename=kml_filename, include_paths=True)
-                logger.info(f"KML: {kml_path}")
+                logger.info("KML: %s", kml_path)
 
             # Summary statistics
             stats = data_logger.get_summary_statistics()
-            elapsed_total = time.time() - start_time
+            elapsed_total = time.monotonic() - start_time
             logger.info("\n=== Session Summary ===")
-            logger.info(f"Collection time: {elapsed_total/60:.1f} minutes")
-            logger.info(f"Total scans: {scan_count}")
-            logger.info(f"Total measurements: {stats['total_measurements']}")
-            logger.info(f"Bands scanned: {', '.join(stats['bands_scanned'])}")
-            logger.info(f"Signal range: {stats['signal_stats']['min_dbm']:.1f} to {stats['signal_stats']['max_dbm']:.1f} dBm")
+            logger.info("Collection time: %.1f minutes", elapsed_total/60)
+            logger.info("Total scans: %s", scan_count)
+            logger.info("Total measurements: %s", stats['total_measurements'])
+            logger.info("Bands scanned: %s", ', '.join(stats['bands_scanned']))
+            logger.info("Signal range: %.1f to %.1f dBm", stats['signal_stats']['min_dbm'], stats['signal_stats']['max_dbm'])
             logger.info("\nℹ️  To generate interactive heatmap, run:")
-            logger.info(f"   python src/main.py --mode visualize --input {json_path}")
+            logger.info("   python src/main.py --mode visualize --input %s", json_path)
 
         logger.info("\n=== Scan Session Complete ===")
 
         # Cleanup devices
         scanner.close()
-        gps_reader.disconnect()
+        data_logger.close()
 
 
 def visualize_mode(config: dict, input_file: str, band_name: str = 'band_5'):
@@ -364,8 +657,10 @@ def visualize_mode(config: dict, input_file: str, band_name: str = 'band_5'):
     Args:
         config: Configuration dictionary
         input_file: Path to JSON file from previous scan
-        band_name: Band to visualize (default: band_5)
+        band_name: Band to visualize (default: band_5), or 'all' for one map per band
     """
+    from visualization import InteractiveHeatmapGenerator
+
     logger = logging.getLogger(__name__)
     logger.info("=== Starting Visualization Mode ===")
     logger.info(f"Input file: {input_file}")
@@ -387,15 +682,21 @@ def visualize_mode(config: dict, input_file: str, band_name: str = 'band_5'):
         # Create visualization generator
         viz_gen = InteractiveHeatmapGenerator(config)
 
-        # Generate interactive map
-        logger.info("Generating interactive heatmap...")
-        output_path = viz_gen.generate_interactive_map(
-            str(input_path),
-            band_name=band_name
-        )
+        # Generate interactive map(s)
+        if band_name == 'all':
+            output_paths = viz_gen.generate_all_bands(str(input_path))
+            if not output_paths:
+                raise ValueError("No band in the log has valid signal data")
+        else:
+            logger.info("Generating interactive heatmap...")
+            output_paths = {band_name: viz_gen.generate_interactive_map(
+                str(input_path),
+                band_name=band_name
+            )}
 
         logger.info("\n=== Visualization Complete ===")
-        logger.info(f"✓ Interactive map saved to: {output_path}")
+        for output_path in output_paths.values():
+            logger.info(f"✓ Interactive map saved to: {output_path}")
         logger.info(f"\nTo view:")
         logger.info(f"  1. Open the file in any web browser")
         logger.info(f"  2. Use mouse to pan and zoom")
@@ -454,7 +755,7 @@ def main():
         '--band',
         type=str,
         default='band_5',
-        help='Band to visualize (default: band_5)'
+        help="Band to visualize, or 'all' for one map per band (default: band_5)"
     )
 
     parser.add_argument(
@@ -4,16 +4,26 @@ Uses rtl_power tool directly for maximum compatibility
 """
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import logging
 from typing import Dict, List, Tuple, Optional
 import time
-import tempfile
 import os
-from pathlib import Path
+import shutil
 
 logger = logging.getLogger(__name__)
 
+# rtl_power paths whose device probe already passed in this process
+_verified_paths = set()
+
+# Checked when rtl_power is not on PATH
+RTL_POWER_LOCATIONS = (
+    r"C:\Users\jainv\Downloads\rtlsdr-bin-w64_static\rtl_power.exe",
+    "/usr/bin/rtl_power",  # Linux
+    "/usr/local/bin/rtl_power",  # Linux alternative
+)
+
 
 class RTLScannerCLI:
     """Interface for RTL-SDR based signal strength scanning using command-line tools"""
@@ -29,6 +39,19 @@ class RTLScannerCLI:
         self.is_initialized = False
         self.rtl_power_path = None
 
+        # Scan settings used on every sweep, read once
+        scan_config = config.get('scan', {})
+        self._integration_time = float(scan_config.get('integration_time', 1.0))
+        self._merge_gap_hz = float(scan_config.get('merge_gap_mhz', 0)) * 1e6
+        self._default_device = config['rtl_sdr']['device_index']
+
+        # Sweep plan of the last bands config scanned, keyed by its contents (see _scan_plan)
+        self._plan_key: Optional[Tuple] = None
+        self._plan: Tuple[List[str], Dict[int, List[Tuple]]] = ([], {})
+
+        # Read-only frequency axes keyed by the (Hz low, Hz high, bins) of each hop
+        self._frequency_axes: Dict[Tuple[Tuple[float, float, int], ...], np.ndarray] = {}
+
     def initialize(self) -> bool:
         """
         Initialize RTL-SDR device and locate rtl_power tool
@@ -37,26 +60,7 @@ class RTLScannerCLI:
             True if successful, False otherwise
         """
         try:
-            # Check if rtl_power is available
-            possible_paths = [
-                r"C:\Users\jainv\Downloads\rtlsdr-bin-w64_static\rtl_power.exe",
-                "rtl_power.exe",  # In PATH
-                "/usr/bin/rtl_power",  # Linux
-                "/usr/local/bin/rtl_power",  # Linux alternative
-            ]
-
-            for path in possible_paths:
-                if os.path.exists(path):
-                    self.rtl_power_path = path
-                    break
-                elif path.endswith('.exe'):
-                    # Try running it to see if it's in PATH
-                    try:
-                        subprocess.run([path, "--help"], capture_output=True, timeout=2)
-                        self.rtl_power_path = path
-                        break
-                    except:
-                        continue
+            self.rtl_power_path = self._locate_rtl_power()
 
             if not self.rtl_power_path:
                 logger.error("rtl_power tool not found. Please install rtl-sdr tools.")
@@ -64,6 +68,12 @@ class RTLScannerCLI:
 
             logger.info(f"Found rtl_power at: {self.rtl_power_path}")
 
+            # The device probe takes seconds; once it passed, later initializations skip it
+            if self.rtl_power_path in _verified_paths:
+                logger.info("RTL-SDR device already verified in this session")
+                self.is_initialized = True
+                return True
+
             # Test if RTL-SDR device is accessible
             try:
                 test_path = self.rtl_power_path.replace("rtl_power.exe", "rtl_test.exe").replace("rtl_power", "rtl_test")
@@ -82,6 +92,7 @@ class RTLScannerCLI:
                 output = result.stdout + result.stderr
                 if "Found" in output and "device" in output:
                     logger.info("RTL-SDR device detected successfully")
+                    _verified_paths.add(self.rtl_power_path)
                     self.is_initialized = True
                     return True
                 else:
@@ -93,6 +104,7 @@ class RTLScannerCLI:
             except subprocess.TimeoutExpired:
                 # Timeout is OK - means device is working
                 logger.info("RTL-SDR device detected (test timeout)")
+                _verified_paths.add(self.rtl_power_path)
                 self.is_initialized = True
                 return True
             except Exception as e:
@@ -103,8 +115,58 @@ class RTLScannerCLI:
             logger.error(f"Error initializing RTL-SDR scanner: {e}")
             return False
 
+    @staticmethod
+    def _locate_rtl_power() -> Optional[str]:
+        """
+        Search PATH and the usual install locations for rtl_power
+
+        Returns:
+            Path of rtl_power, or None if not found
+        """
+        # One PATH walk, no probe processes
+        path = shutil.which("rtl_power") or shutil.which("rtl_power.exe")
+        if path:
+            return path
+
+        # Install locations that are usually not on PATH
+        return next((path for path in RTL_POWER_LOCATIONS if os.path.exists(path)), None)
+
+    @staticmethod
+    def _parse_power_values(text: bytes) -> np.ndarray:
+        """
+        Convert the dB fields of an rtl_power line to floats, mapping unusable values to -999
+
+        Args:
+            text: Comma-separated dB columns of one rtl_power CSV line (raw ASCII bytes)
+
+        Returns:
+            Array of power values in dB
+        """
+        count = text.count(b',') + 1
+        try:
+            # Parsed in C straight from the string, without a list of field strings
+            powers = np.fromstring(text, sep=',')
+        except ValueError:
+            powers = None
+
+        # NumPy < 2.3 stops at a malformed field instead of raising
+        if powers is None or len(powers) != count:
+            powers = np.empty(count)
+            for i, x in enumerate(text.split(b',')):
+                try:
+                    powers[i] = float(x)
+                except (ValueError, OverflowError):
+                    powers[i] = np.nan
+
+        # Replace NaN/Inf (and absurd magnitudes) with -999 (no signal)
+        valid = np.abs(powers) < 1e10
+        if not valid.all():
+            powers = np.where(valid, powers, -999.0)
+        return powers
+
     def scan_frequency_range(self, start_freq_hz: float, end_freq_hz: float,
-                            integration_time: float = 1.0) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+                            integration_time: float = 1.0,
+                            device_index: Optional[int] = None) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """
         Scan a frequency range and return signal strength
 
@@ -112,6 +174,7 @@ class RTLScannerCLI:
             start_freq_hz: Start frequency in Hz
             end_freq_hz: End frequency in Hz
             integration_time: Integration time in seconds
+            device_index: RTL-SDR device to use (default: rtl_sdr.device_index)
 
         Returns:
             Tuple of (frequencies_hz, power_db) or None on error
@@ -121,10 +184,6 @@ class RTLScannerCLI:
             return None
 
         try:
-            # Create temporary file for output
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as tmp:
-                tmp_path = tmp.name
-
             # Calculate parameters for rtl_power
             # rtl_power usage: rtl_power -f start:end:step -i interval output.csv
             freq_range_mhz = (end_freq_hz - start_freq_hz) / 1e6
@@ -133,6 +192,9 @@ class RTLScannerCLI:
             start_mhz = start_freq_hz / 1e6
             end_mhz = end_freq_hz / 1e6
 
+            if device_index is None:
+                device_index = self._default_device
+
             # Build command
             # Note: rtl_power -i requires integer seconds, minimum 1
             integration_seconds = max(1, int(integration_time))
@@ -142,82 +204,74 @@ class RTLScannerCLI:
                 "-f", f"{start_mhz}M:{end_mhz}M:1k",  # Freq range with 1kHz steps
                 "-i", str(integration_seconds),  # Integration interval (minimum 1 second)
                 "-1",  # Single scan
-                "-d", str(self.config['rtl_sdr']['device_index']),  # Device index
+                "-d", str(device_index),  # Device index
                 "-g", str(self.config['rtl_sdr']['gain']),  # Gain
-                tmp_path
+                "-"  # Write the CSV to stdout, no temporary file
             ]
 
-            logger.debug(f"Running: {' '.join(cmd)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Running: %s", ' '.join(cmd))
 
-            # Run rtl_power
+            # Run rtl_power; the CSV is ASCII, so it is parsed as bytes without decoding
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=integration_seconds + 10
             )
 
             if result.returncode != 0:
-                logger.error(f"rtl_power error: {result.stderr}")
-                os.unlink(tmp_path)
+                logger.error(f"rtl_power error: {result.stderr.decode(errors='replace')}")
                 return None
 
             # Parse output CSV
             # rtl_power CSV format: date, time, Hz low, Hz high, Hz step, samples, dB, dB, dB...
+            # Ranges wider than the tuner bandwidth are hopped: one line per hop
             try:
-                with open(tmp_path, 'r') as f:
-                    lines = f.readlines()
+                hops = []
+                hop_powers = []
+                for line in result.stdout.splitlines():
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    # Parse the CSV line
+                    parts = line.split(b',', 6)
+                    hz_low = float(parts[2])
+                    hz_high = float(parts[3])
 
-                os.unlink(tmp_path)
+                    # Parse all power values in one C-level conversion
+                    powers = self._parse_power_values(parts[6])
+                    hop_powers.append(powers)
+                    hops.append((hz_low, hz_high, len(powers)))
 
-                if not lines:
+                if not hop_powers:
                     logger.error("rtl_power produced no output")
                     return None
 
-                # Parse the CSV line
-                parts = lines[0].strip().split(',')
-                hz_low = float(parts[2])
-                hz_high = float(parts[3])
-                hz_step = float(parts[4])
-
-                # Parse power values, handling invalid/NaN values
-                power_values = []
-                for x in parts[6:]:
-                    try:
-                        # Try to convert to float
-                        val = float(x.strip())
-                        # Replace NaN/Inf with -999 (no signal)
-                        if not (val == val and abs(val) < 1e10):  # Check for NaN and Inf
-                            val = -999.0
-                        power_values.append(val)
-                    except (ValueError, OverflowError):
-                        # If conversion fails, use -999 (no signal)
-                        power_values.append(-999.0)
-
-                # Generate frequency array
-                num_bins = len(power_values)
-                frequencies = np.linspace(hz_low, hz_high, num_bins)
-                powers = np.array(power_values)
-
-                logger.debug(f"Scanned {len(frequencies)} frequency bins from {hz_low/1e6:.2f} to {hz_high/1e6:.2f} MHz")
+                # The same bands are swept over and over: reuse their frequency axis
+                hops = tuple(hops)
+                frequencies = self._frequency_axes.get(hops)
+                if frequencies is None:
+                    frequencies = np.concatenate([np.linspace(lo, hi, n) for lo, hi, n in hops])
+                    frequencies.flags.writeable = False
+                    self._frequency_axes[hops] = frequencies
+
+                powers = hop_powers[0] if len(hop_powers) == 1 else np.concatenate(hop_powers)
+
+                logger.debug("Scanned %d frequency bins from %.2f to %.2f MHz",
+                             len(frequencies), frequencies[0] / 1e6, frequencies[-1] / 1e6)
 
                 return frequencies, powers
 
             except Exception as e:
                 logger.error(f"Error parsing rtl_power output: {e}")
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
                 return None
 
         except subprocess.TimeoutExpired:
             logger.error("rtl_power timeout")
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
             return None
         except Exception as e:
             logger.error(f"Error scanning frequency range: {e}")
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
             return None
 
     def scan_lte_bands(self, bands_config: Dict) -> Dict[str, float]:
@@ -230,58 +284,174 @@ class RTLScannerCLI:
         Returns:
             Dictionary mapping band name to average power in dBm
         """
-        results = {}
+        band_order, by_device = self._scan_plan(bands_config)
+
+        if len(by_device) <= 1:
+            scanned = {}
+            for device_index, sweeps in by_device.items():
+                scanned = self._scan_device(device_index, sweeps)
+        else:
+            # A dongle tunes one range at a time: bands on different devices run
+            # concurrently, bands sharing a device still run back to back
+            scanned = {}
+            with ThreadPoolExecutor(max_workers=len(by_device), thread_name_prefix='rtl-scan') as pool:
+                for device_results in pool.map(self._scan_device, by_device.keys(), by_device.values()):
+                    scanned.update(device_results)
+
+        # Keep the configured band order
+        return {band_name: scanned[band_name] for band_name in band_order}
+
+    def _scan_plan(self, bands_config: Dict) -> Tuple[List[str], Dict[int, List[Tuple]]]:
+        """
+        Work out which sweeps each dongle runs for a bands config
 
-        for band_name, band_config in bands_config.items():
-            if not band_config.get('enabled', False):
-                logger.debug(f"Skipping disabled band: {band_name}")
-                continue
+        Enabled bands are grouped by device. Within a device, bands whose
+        ranges overlap or lie within scan.merge_gap_mhz of each other share
+        one rtl_power sweep that is split per band afterwards. The plan is
+        reused while the enabled bands, their devices and ranges, and the
+        merge gap are unchanged, so editing the config in place is picked up.
 
-            logger.info(f"Scanning {band_name}...")
+        Args:
+            bands_config: Dictionary of band configurations
+
+        Returns:
+            Tuple of (enabled band names in config order,
+            {device_index: [(start_hz, end_hz, ((band_name, start_hz, end_hz), ...)), ...]})
+        """
+        enabled = tuple(
+            (band_name, band_config.get('device_index', self._default_device)) + self._band_range(band_config)
+            for band_name, band_config in bands_config.items()
+            if band_config.get('enabled', False)
+        )
+        key = (enabled, self._merge_gap_hz)
+        if key == self._plan_key:
+            return self._plan
+
+        band_order = []
+        ranges: Dict[int, List[Tuple[float, float, str]]] = {}
+        for band_name, device_index, start, end in enabled:
+            band_order.append(band_name)
+            ranges.setdefault(device_index, []).append((start, end, band_name))
+
+        by_device = {}
+        for device_index, device_ranges in ranges.items():
+            # Merge the sorted band ranges into sweeps of [start, end, members]
+            sweeps = []
+            for start, end, band_name in sorted(device_ranges):
+                if sweeps and start - sweeps[-1][1] <= self._merge_gap_hz:
+                    sweeps[-1][1] = max(sweeps[-1][1], end)
+                    sweeps[-1][2].append((band_name, start, end))
+                else:
+                    sweeps.append([start, end, [(band_name, start, end)]])
+            by_device[device_index] = [(start, end, tuple(members)) for start, end, members in sweeps]
+
+        self._plan_key = key
+        self._plan = (band_order, by_device)
+        return self._plan
+
+    @staticmethod
+    def _band_range(band_config: Dict) -> Tuple[float, float]:
+        """
+        Get a band's downlink range in Hz
+
+        Args:
+            band_config: Band configuration
+
+        Returns:
+            Tuple of (start_hz, end_hz)
+        """
+        # Get downlink frequency range (handle both Hz and MHz formats)
+        freq_start = float(band_config.get('downlink_start_mhz', band_config.get('downlink_start', 0)))
+        freq_end = float(band_config.get('downlink_end_mhz', band_config.get('downlink_end', 0)))
+
+        # Convert to Hz if in MHz
+        if freq_start < 1e6:
+            freq_start *= 1e6
+        if freq_end < 1e6:
+            freq_end *= 1e6
+
+        return freq_start, freq_end
 
-            # Get downlink frequency range (handle both Hz and MHz formats)
-            freq_start = float(band_config.get('downlink_start_mhz', band_config.get('downlink_start', 0)))
-            freq_end = float(band_config.get('downlink_end_mhz', band_config.get('downlink_end', 0)))
+    def _scan_device(self, device_index: int, sweeps: List[Tuple]) -> Dict[str, Dict]:
+        """
+        Run one dongle's sweeps and split them into per-band results
+
+        Args:
+            device_index: RTL-SDR device the bands are scanned on
+            sweeps: The device's (start_hz, end_hz, members) entries from _scan_plan
 
-            # Convert to Hz if in MHz
-            if freq_start < 1e6:
-                freq_start *= 1e6
-            if freq_end < 1e6:
-                freq_end *= 1e6
+        Returns:
+            Dictionary mapping band name to its result
+        """
+        results = {}
+        for start, end, members in sweeps:
+            if len(members) == 1:
+                logger.info(f"Scanning {members[0][0]}...")
+            else:
+                logger.info(f"Scanning {', '.join(name for name, _, _ in members)} "
+                            f"in one sweep ({start/1e6:.1f}-{end/1e6:.1f} MHz)...")
 
             scan_result = self.scan_frequency_range(
-                freq_start,
-                freq_end,
-                integration_time=self.config.get('scan', {}).get('integration_time', 1.0)
+                start,
+                end,
+                integration_time=self._integration_time,
+                device_index=device_index
             )
 
-            if scan_result:
+            for band_name, band_start, band_end in members:
+                if not scan_result:
+                    results[band_name] = self._summarize_band(band_name, None, None)
+                    continue
+
                 frequencies, powers = scan_result
-                avg_power = np.mean(powers)
-                max_power = np.max(powers)
-
-                # Store both summary and raw data
-                results[band_name] = {
-                    'average_power_dbm': float(avg_power),
-                    'max_power_dbm': float(max_power),
-                    'frequency_mhz': float(frequencies[np.argmax(powers)] / 1e6),
-                    'num_samples': len(frequencies),
-                    'raw_data': list(zip(frequencies, powers))  # Add raw (freq, power) pairs
-                }
-
-                logger.info(f"{band_name}: Avg={avg_power:.2f} dBm, Max={max_power:.2f} dBm")
-            else:
-                logger.warning(f"Failed to scan {band_name}")
-                results[band_name] = {
-                    'average_power_dbm': -999.0,
-                    'max_power_dbm': -999.0,
-                    'frequency_mhz': 0.0,
-                    'num_samples': 0,
-                    'raw_data': []  # Empty list for consistency
-                }
+                if len(members) > 1:
+                    # Bins of the shared sweep that fall inside this band
+                    lo = np.searchsorted(frequencies, band_start, side='left')
+                    hi = np.searchsorted(frequencies, band_end, side='right')
+                    frequencies, powers = frequencies[lo:hi], powers[lo:hi]
+                results[band_name] = self._summarize_band(band_name, frequencies, powers)
 
         return results
 
+    @staticmethod
+    def _summarize_band(band_name: str,
+                        frequencies: Optional[np.ndarray],
+                        powers: Optional[np.ndarray]) -> Dict:
+        """
+        Summarize one band's scanned bins
+
+        Args:
+            band_name: Name of the band
+            frequencies: Bin frequencies in Hz (None if the scan failed)
+            powers: Bin powers in dB (None if the scan failed)
+
+        Returns:
+            Result dictionary with summary values and an (N, 2) raw freq/power array
+        """
+        if powers is not None and len(powers):
+            avg_power = np.mean(powers)
+            max_power = np.max(powers)
+
+            logger.info(f"{band_name}: Avg={avg_power:.2f} dBm, Max={max_power:.2f} dBm")
+
+            # Store both summary and raw data
+            return {
+                'average_power_dbm': float(avg_power),
+                'max_power_dbm': float(max_power),
+                'frequency_mhz': float(frequencies[np.argmax(powers)] / 1e6),
+                'num_samples': len(frequencies),
+                'raw_data': np.column_stack((frequencies, powers))  # (N, 2) freq/power array
+            }
+
+        logger.warning(f"Failed to scan {band_name}")
+        return {
+            'average_power_dbm': -999.0,
+            'max_power_dbm': -999.0,
+            'frequency_mhz': 0.0,
+            'num_samples': 0,
+            'raw_data': np.empty((0, 2))  # Empty array for consistency
+        }
+
     def close(self):
         """Close RTL-SDR device"""
         self.is_initialized = False
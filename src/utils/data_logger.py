@@ -5,14 +5,58 @@ Handles logging of signal strength measurements with GPS coordinates and timesta
 
 import json
 import csv
+import itertools
 import logging
+import math
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
+
+# orjson encodes straight to UTF-8 bytes, several times faster than json.dump
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyarrow is only needed for the optional Parquet export
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Column layout of the in-memory store (order matches the exported files)
+_FLOAT_COLUMNS = ('latitude', 'longitude', 'altitude', 'frequency_mhz', 'signal_dbm')
+
+# Signal strength is held as float32 (~0.1 dB is meaningful); exported values
+# are rounded so float32 representation error doesn't show up in the files
+SIGNAL_DTYPE = np.float32
+SIGNAL_DECIMALS = 4
+_COLUMN_ORDER = ('timestamp', 'latitude', 'longitude', 'altitude', 'band', 'frequency_mhz', 'signal_dbm')
+
+# Initial number of rows allocated per column; capacity doubles when full
+_INITIAL_CAPACITY = 1024
+
+# Write buffer of the streamed session CSV
+CSV_BUFFER_SIZE = 1 << 20
+
+# Per-location signal histograms: 0.5 dB bins from -140 to -40 dBm
+HIST_MIN_DBM = -140.0
+HIST_MAX_DBM = -40.0
+HIST_BIN_DB = 0.5
+HIST_BINS = int((HIST_MAX_DBM - HIST_MIN_DBM) / HIST_BIN_DB)
+
+# Decimal places of the histogram cell coordinates (~11 m)
+HIST_CELL_DECIMALS = 4
+
 
 class DataLogger:
     """Logs signal measurement data to various formats"""
@@ -31,8 +75,301 @@ class DataLogger:
         # Create session ID based on timestamp
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # In-memory storage for current session
-        self.measurements: List[Dict] = []
+        # Session CSV written as measurements arrive (when CSV export is enabled)
+        self._stream_csv = config.get('export', {}).get('csv_enabled', False)
+        self._csv_path = self.data_dir / f"signal_data_{self.session_id}.csv"
+        self._csv_file = None
+        self._csv_writer = None
+        self._csv_started = False
+
+        # In-memory storage for current session: one growable array per column
+        self._columns: Dict[str, np.ndarray] = {}
+        self._n = 0
+        self._allocate(_INITIAL_CAPACITY)
+
+        # Band names are stored once; the band column holds their indices
+        self._band_names: List[str] = []
+        self._band_codes: Dict[str, int] = {}
+
+        # Spatial index for location queries and the row count it was built at
+        self._kdtree: Tuple[Optional[cKDTree], np.ndarray] = (None, np.empty(0, dtype=np.intp))
+        self._kdtree_n = 0
+
+        # Signal histogram per (band, latitude cell, longitude cell); with
+        # keep_raw_measurements off only these are kept, not every bin sample
+        self._keep_raw = config['logging'].get('keep_raw_measurements', True)
+        self._histograms: Dict[Tuple[str, Optional[float], Optional[float]], np.ndarray] = {}
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Resize every column to hold capacity rows, keeping the logged ones
+
+        Args:
+            capacity: New number of rows per column
+        """
+        columns = {name: np.full(capacity, np.nan) for name in _FLOAT_COLUMNS}
+        columns['signal_dbm'] = np.full(capacity, np.nan, dtype=SIGNAL_DTYPE)
+        # Epoch nanoseconds; formatted as ISO strings only when exported
+        columns['timestamp'] = np.zeros(capacity, dtype=np.int64)
+        # Index into self._band_names
+        columns['band'] = np.zeros(capacity, dtype=np.int16)
+
+        n = self._n
+        for name, old in self._columns.items():
+            columns[name][:n] = old[:n]
+
+        self._columns = columns
+
+    def _reserve(self, count: int) -> int:
+        """
+        Make room for count more rows
+
+        Args:
+            count: Number of rows about to be written
+
+        Returns:
+            Index of the first free row
+        """
+        start = self._n
+        capacity = len(self._columns['latitude'])
+        if start + count > capacity:
+            while start + count > capacity:
+                capacity *= 2
+            self._allocate(capacity)
+        self._n = start + count
+        return start
+
+    @staticmethod
+    def _optional(value: Optional[float]) -> float:
+        """Store a missing value (coordinate or signal) as NaN"""
+        return np.nan if value is None else value
+
+    def _band_code(self, band_name: str) -> int:
+        """
+        Get the stored index for a band name, registering new bands
+
+        Args:
+            band_name: Name of the LTE band
+
+        Returns:
+            Index into the band name table
+        """
+        code = self._band_codes.get(band_name)
+        if code is None:
+            code = len(self._band_names)
+            self._band_names.append(band_name)
+            self._band_codes[band_name] = code
+        return code
+
+    def _decode_bands(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Map stored band indices back to names
+
+        Args:
+            codes: Values of the band column
+
+        Returns:
+            Object array of band names
+        """
+        return np.array(self._band_names, dtype=object)[codes]
+
+    @staticmethod
+    def _timestamp_ns(timestamp: Optional[Union[datetime, int]]) -> int:
+        """
+        Normalize a measurement time to epoch nanoseconds
+
+        Args:
+            timestamp: datetime, epoch nanoseconds, or None for now
+
+        Returns:
+            Epoch time in nanoseconds
+        """
+        if timestamp is None:
+            return time.time_ns()
+        if isinstance(timestamp, datetime):
+            return round(timestamp.timestamp() * 1e6) * 1000
+        return timestamp
+
+    @staticmethod
+    def _format_timestamps(timestamps_ns: np.ndarray) -> np.ndarray:
+        """
+        Convert epoch nanoseconds to local-time ISO 8601 strings
+
+        Args:
+            timestamps_ns: Epoch times in nanoseconds
+
+        Returns:
+            Array of strings like 2024-01-01T12:00:00.000000
+        """
+        if len(timestamps_ns) == 0:
+            return np.array([], dtype=str)
+
+        # A session is short, so the UTC offset in effect at its first sample is used throughout
+        offset = datetime.fromtimestamp(timestamps_ns[0] / 1e9).astimezone().utcoffset()
+        local_ns = timestamps_ns + int(offset.total_seconds()) * 1_000_000_000
+        return np.datetime_as_string(local_ns.astype('datetime64[ns]').astype('datetime64[us]'), unit='us')
+
+    @property
+    def measurements(self) -> List[Dict]:
+        """
+        Logged measurements as a list of dictionaries
+
+        Returns:
+            One dictionary per measurement; missing coordinates are None
+        """
+        return self._rows(slice(0, self._n))
+
+    def _rows(self, rows) -> List[Dict]:
+        """
+        Build measurement dictionaries for selected rows
+
+        Args:
+            rows: Slice or index array into the logged rows
+
+        Returns:
+            List of measurement dictionaries
+        """
+        session_id = self.session_id
+        return [dict(zip(_COLUMN_ORDER, row), session_id=session_id)
+                for row in zip(*self._column_lists(rows))]
+
+    @staticmethod
+    def _export_signal(values: np.ndarray) -> np.ndarray:
+        """
+        Widen stored signal strengths to float64 for export
+
+        Args:
+            values: Values of the signal_dbm column
+
+        Returns:
+            float64 array rounded to SIGNAL_DECIMALS
+        """
+        return np.round(values.astype(np.float64), SIGNAL_DECIMALS)
+
+    def _column_lists(self, rows) -> List[list]:
+        """
+        Export selected rows as Python lists, one per column in _COLUMN_ORDER
+
+        Args:
+            rows: Slice or index array into the logged rows
+
+        Returns:
+            Column value lists; missing coordinates are None
+        """
+        columns = []
+        for name in _COLUMN_ORDER:
+            values = self._columns[name][:self._n][rows]
+            if name == 'signal_dbm':
+                values = self._export_signal(values)
+            if name in _FLOAT_COLUMNS:
+                values = np.where(np.isnan(values), None, values)
+            elif name == 'timestamp':
+                values = self._format_timestamps(values)
+            elif name == 'band':
+                values = self._decode_bands(values)
+            columns.append(values.tolist())
+        return columns
+
+    def _accumulate_histogram(self,
+                              band_name: str,
+                              latitude: float,
+                              longitude: float,
+                              powers: np.ndarray) -> None:
+        """
+        Add power samples to the histogram of their band and location cell
+
+        Args:
+            band_name: Name of the LTE band
+            latitude: GPS latitude (NaN if unknown)
+            longitude: GPS longitude (NaN if unknown)
+            powers: Signal strengths in dBm
+        """
+        # Drop the -999 dBm failed-bin sentinel (and NaN)
+        powers = powers[powers > -999.0]
+        if len(powers) == 0:
+            return
+
+        bins = np.clip(((powers - HIST_MIN_DBM) / HIST_BIN_DB).astype(np.intp), 0, HIST_BINS - 1)
+        self._histogram(band_name, latitude, longitude)[:] += np.bincount(bins, minlength=HIST_BINS)
+
+    def _histogram(self, band_name: str, latitude: float, longitude: float) -> np.ndarray:
+        """
+        Get (creating if needed) the histogram of a band and location cell
+
+        Args:
+            band_name: Name of the LTE band
+            latitude: GPS latitude (NaN if unknown)
+            longitude: GPS longitude (NaN if unknown)
+
+        Returns:
+            Histogram counts, updated in place by the caller
+        """
+        key = (band_name,
+               None if math.isnan(latitude) else round(float(latitude), HIST_CELL_DECIMALS),
+               None if math.isnan(longitude) else round(float(longitude), HIST_CELL_DECIMALS))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = np.zeros(HIST_BINS, dtype=np.int64)
+        return histogram
+
+    @staticmethod
+    def histogram_quantiles(histogram: np.ndarray, quantiles) -> np.ndarray:
+        """
+        Estimate signal quantiles from a histogram's cumulative counts
+
+        Args:
+            histogram: Sample counts per HIST_BIN_DB bin
+            quantiles: Quantile or sequence of quantiles in [0, 1]
+
+        Returns:
+            Bin-center signal strengths in dBm
+        """
+        cdf = np.cumsum(histogram)
+        bins = np.searchsorted(cdf, np.asarray(quantiles) * cdf[-1])
+        return HIST_MIN_DBM + (np.minimum(bins, HIST_BINS - 1) + 0.5) * HIST_BIN_DB
+
+    def get_signal_histograms(self) -> List[Dict]:
+        """
+        Get the per-location signal histograms of the session
+
+        Returns:
+            One dictionary per (band, location cell) with sample count,
+            median and the raw bin counts (as an array)
+        """
+        cells = []
+        for (band_name, latitude, longitude), histogram in self._histograms.items():
+            p10, median, p90 = self.histogram_quantiles(histogram, (0.1, 0.5, 0.9)).tolist()
+            cells.append({
+                'band': band_name,
+                'latitude': latitude,
+                'longitude': longitude,
+                'count': int(histogram.sum()),
+                'median_dbm': median,
+                'p10_dbm': p10,
+                'p90_dbm': p90,
+                'counts': histogram.copy()
+            })
+        return cells
+
+    def _append_csv(self, start: int) -> None:
+        """
+        Append rows logged since start to the session CSV, creating it on first use
+
+        Args:
+            start: Index of the first row not yet written
+        """
+        if self._csv_file is None:
+            # Reopened after close(): keep appending below the existing header
+            self._csv_file = open(self._csv_path, 'a' if self._csv_started else 'w',
+                                  newline='', buffering=CSV_BUFFER_SIZE)
+            self._csv_writer = csv.writer(self._csv_file)
+            if not self._csv_started:
+                self._csv_writer.writerow(_COLUMN_ORDER + ('session_id',))
+                self._csv_started = True
+
+        columns = self._column_lists(slice(start, self._n))
+        columns.append(itertools.repeat(self.session_id))
+        self._csv_writer.writerows(zip(*columns))
 
     def log_measurement(self,
                        latitude: Optional[float],
@@ -41,7 +378,7 @@ class DataLogger:
                        band_name: str,
                        frequency: float,
                        signal_strength: float,
-                       timestamp: Optional[datetime] = None) -> None:
+                       timestamp: Optional[Union[datetime, int]] = None) -> None:
         """
         Log a single measurement
 
@@ -52,32 +389,104 @@ class DataLogger:
             band_name: Name of the LTE band
             frequency: Frequency in Hz
             signal_strength: Signal strength in dBm
-            timestamp: Measurement timestamp (uses current time if None)
+            timestamp: Measurement time as a datetime or epoch nanoseconds
+                (uses current time if None)
         """
-        if timestamp is None:
-            timestamp = datetime.now()
-
-        measurement = {
-            'timestamp': timestamp.isoformat(),
-            'latitude': latitude,
-            'longitude': longitude,
-            'altitude': altitude,
-            'band': band_name,
-            'frequency_mhz': frequency / 1e6,
-            'signal_dbm': signal_strength,
-            'session_id': self.session_id
-        }
+        # One sample: bump its bin directly (the comparison also drops NaN)
+        if signal_strength is not None and signal_strength > -999.0:
+            bin_index = min(max(int((signal_strength - HIST_MIN_DBM) / HIST_BIN_DB), 0), HIST_BINS - 1)
+            self._histogram(band_name, self._optional(latitude), self._optional(longitude))[bin_index] += 1
+        if not self._keep_raw:
+            return
+
+        i = self._reserve(1)
+        columns = self._columns
+        columns['timestamp'][i] = self._timestamp_ns(timestamp)
+        columns['latitude'][i] = self._optional(latitude)
+        columns['longitude'][i] = self._optional(longitude)
+        columns['altitude'][i] = self._optional(altitude)
+        columns['band'][i] = self._band_code(band_name)
+        columns['frequency_mhz'][i] = frequency / 1e6
+        columns['signal_dbm'][i] = self._optional(signal_strength)
+
+        if self._stream_csv:
+            self._append_csv(i)
+
+        # Called per sample: lazy %-formatting, nothing built unless DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Logged measurement: %s @ %.2f MHz = %.2f dBm", band_name, frequency / 1e6, signal_strength)
+
+    def log_bulk(self,
+                 latitude: Optional[float],
+                 longitude: Optional[float],
+                 altitude: Optional[float],
+                 band_name: str,
+                 frequencies: np.ndarray,
+                 powers: np.ndarray,
+                 timestamp: Optional[Union[datetime, int]] = None) -> None:
+        """
+        Log every bin of one band sweep taken at a single position
 
-        self.measurements.append(measurement)
+        Args:
+            latitude: GPS latitude
+            longitude: GPS longitude
+            altitude: Altitude in meters
+            band_name: Name of the LTE band
+            frequencies: Bin frequencies in Hz
+            powers: Bin signal strengths in dBm
+            timestamp: Measurement time as a datetime or epoch nanoseconds
+        """
+        first_row = self._n
+        self._insert(self._timestamp_ns(timestamp), self._optional(latitude),
+                     self._optional(longitude), self._optional(altitude), band_name,
+                     np.asarray(frequencies, dtype=np.float64), np.asarray(powers, dtype=np.float64))
+
+        if self._stream_csv and self._n > first_row:
+            self._append_csv(first_row)
+
+    def _insert(self,
+                timestamp_ns: int,
+                latitude: float,
+                longitude: float,
+                altitude: float,
+                band_name: str,
+                frequencies: np.ndarray,
+                powers: np.ndarray) -> None:
+        """
+        Write one band sweep into the columns as slice assignments
 
-        logger.debug(f"Logged measurement: {band_name} @ {frequency/1e6:.2f} MHz = {signal_strength:.2f} dBm")
+        Args:
+            timestamp_ns: Epoch time in nanoseconds
+            latitude: GPS latitude (NaN if unknown)
+            longitude: GPS longitude (NaN if unknown)
+            altitude: Altitude in meters (NaN if unknown)
+            band_name: Name of the LTE band
+            frequencies: Bin frequencies in Hz
+            powers: Bin signal strengths in dBm
+        """
+        self._accumulate_histogram(band_name, latitude, longitude, powers)
+        if not self._keep_raw or len(powers) == 0:
+            return
+
+        count = len(powers)
+        start = self._reserve(count)
+        rows = slice(start, start + count)
+
+        columns = self._columns
+        columns['timestamp'][rows] = timestamp_ns
+        columns['latitude'][rows] = latitude
+        columns['longitude'][rows] = longitude
+        columns['altitude'][rows] = altitude
+        columns['band'][rows] = self._band_code(band_name)
+        np.divide(frequencies, 1e6, out=columns['frequency_mhz'][rows])
+        columns['signal_dbm'][rows] = powers
 
     def log_scan_results(self,
                         latitude: Optional[float],
                         longitude: Optional[float],
                         altitude: Optional[float],
                         scan_results: Dict[str, List[tuple]],
-                        timestamp: Optional[datetime] = None) -> None:
+                        timestamp: Optional[Union[datetime, int]] = None) -> None:
         """
         Log results from a complete band scan
 
@@ -85,29 +494,34 @@ class DataLogger:
             latitude: GPS latitude
             longitude: GPS longitude
             altitude: Altitude in meters
-            scan_results: Dictionary of {band_name: [(freq, power), ...]}
-            timestamp: Measurement timestamp
+            scan_results: Dictionary of {band_name: [(freq, power), ...]} or
+                {band_name: {'raw_data': (N, 2) array}}
+            timestamp: Measurement time as a datetime or epoch nanoseconds
         """
-        if timestamp is None:
-            timestamp = datetime.now()
+        first_row = self._n
+        timestamp_ns = self._timestamp_ns(timestamp)
+        latitude = self._optional(latitude)
+        longitude = self._optional(longitude)
+        altitude = self._optional(altitude)
 
         for band_name, results in scan_results.items():
-            # Handle both old format [(freq, power), ...] and new format {'raw_data': [...]}
+            # Handle both old format [(freq, power), ...] and new format {'raw_data': ndarray}
             if isinstance(results, dict):
                 raw_data = results.get('raw_data', [])
             else:
                 raw_data = results
 
-            for freq, power in raw_data:
-                self.log_measurement(
-                    latitude=latitude,
-                    longitude=longitude,
-                    altitude=altitude,
-                    band_name=band_name,
-                    frequency=freq,
-                    signal_strength=power,
-                    timestamp=timestamp
-                )
+            if len(raw_data) == 0:
+                continue
+
+            # No copy for float64 arrays
+            samples = np.asarray(raw_data, dtype=np.float64).reshape(-1, 2)
+            self._insert(timestamp_ns, latitude, longitude, altitude, band_name,
+                         samples[:, 0], samples[:, 1])
+
+        # One CSV write for all bands of the scan
+        if self._stream_csv and self._n > first_row:
+            self._append_csv(first_row)
 
     def save_to_csv(self, filename: Optional[str] = None) -> Path:
         """
@@ -124,15 +538,22 @@ class DataLogger:
 
         filepath = self.data_dir / filename
 
-        if not self.measurements:
+        if not self._n:
             logger.warning("No measurements to save")
             return filepath
 
+        # Rows were already written as they were logged
+        if self._csv_started and filepath == self._csv_path:
+            if self._csv_file is not None:
+                self._csv_file.flush()
+            logger.info(f"Saved {self._n} measurements to {filepath}")
+            return filepath
+
         # Convert to DataFrame and save
-        df = pd.DataFrame(self.measurements)
+        df = self.get_dataframe()
         df.to_csv(filepath, index=False)
 
-        logger.info(f"Saved {len(self.measurements)} measurements to {filepath}")
+        logger.info(f"Saved {self._n} measurements to {filepath}")
         return filepath
 
     def save_to_json(self, filename: Optional[str] = None) -> Path:
@@ -150,20 +571,114 @@ class DataLogger:
 
         filepath = self.data_dir / filename
 
-        if not self.measurements:
+        if not self._n and not self._histograms:
             logger.warning("No measurements to save")
             return filepath
 
-        with open(filepath, 'w') as f:
-            json.dump({
-                'session_id': self.session_id,
-                'num_measurements': len(self.measurements),
-                'measurements': self.measurements
-            }, f, indent=2)
+        payload = {
+            'session_id': self.session_id,
+            'num_measurements': self._n,
+            'measurements': self.measurements,
+            'signal_histograms': {
+                'min_dbm': HIST_MIN_DBM,
+                'bin_db': HIST_BIN_DB,
+                'cells': self.get_signal_histograms()
+            }
+        }
+
+        # Compact unless asked for readable output; indentation roughly doubles the file
+        pretty = self.config.get('export', {}).get('json_pretty', False)
+
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+            filepath.write_bytes(orjson.dumps(payload, option=option))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(payload, f, indent=2 if pretty else None, default=np.ndarray.tolist)
+
+        logger.info(f"Saved {self._n} measurements to {filepath}")
+        return filepath
+
+    def save_to_parquet(self, filename: Optional[str] = None) -> Optional[Path]:
+        """
+        Save measurements to a zstd-compressed Parquet file
+
+        Columns are written straight from the in-memory arrays: timestamps as
+        UTC nanoseconds, bands as a dictionary column, missing coordinates as
+        nulls. The session ID is stored in the file metadata.
+
+        Args:
+            filename: Optional custom filename
+
+        Returns:
+            Path to saved Parquet file, or None if pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            logger.warning("pyarrow not installed - skipping Parquet export")
+            return None
+
+        if filename is None:
+            filename = f"signal_data_{self.session_id}.parquet"
+
+        filepath = self.data_dir / filename
+
+        if not self._n:
+            logger.warning("No measurements to save")
+            return filepath
+
+        n = self._n
+        columns = self._columns
+        band_names = pa.array(self._band_names, type=pa.string())
+        arrays = []
+        for name in _COLUMN_ORDER:
+            if name == 'timestamp':
+                arrays.append(pa.array(columns[name][:n], type=pa.timestamp('ns', tz='UTC')))
+            elif name == 'band':
+                arrays.append(pa.DictionaryArray.from_arrays(columns[name][:n], band_names))
+            else:
+                arrays.append(pa.array(columns[name][:n], from_pandas=True))
+
+        table = pa.Table.from_arrays(arrays, names=list(_COLUMN_ORDER))
+        table = table.replace_schema_metadata({'session_id': self.session_id})
+        pq.write_table(table, filepath, compression='zstd')
 
-        logger.info(f"Saved {len(self.measurements)} measurements to {filepath}")
+        logger.info(f"Saved {n} measurements to {filepath}")
         return filepath
 
+    def load_from_parquet(self, filepath: Union[str, Path]) -> int:
+        """
+        Append measurements from a Parquet file written by save_to_parquet
+
+        Args:
+            filepath: Path to the Parquet file
+
+        Returns:
+            Number of measurements loaded
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required to read Parquet files")
+
+        table = pq.read_table(filepath, columns=list(_COLUMN_ORDER))
+        count = table.num_rows
+        if not count:
+            return 0
+
+        # Map the file's band dictionary onto this logger's band table
+        bands = table.column('band').combine_chunks()
+        codes = np.array([self._band_code(name) for name in bands.dictionary.to_pylist()], dtype=np.int16)
+
+        start = self._reserve(count)
+        rows = slice(start, start + count)
+        columns = self._columns
+        columns['timestamp'][rows] = table.column('timestamp').cast(pa.int64()).to_numpy()
+        columns['band'][rows] = codes[bands.indices.to_numpy()]
+        for name in _FLOAT_COLUMNS:
+            # Nulls come back as NaN
+            columns[name][rows] = table.column(name).to_numpy()
+
+        logger.info(f"Loaded {count} measurements from {filepath}")
+        return count
+
     def get_dataframe(self) -> pd.DataFrame:
         """
         Get measurements as pandas DataFrame
@@ -171,7 +686,16 @@ class DataLogger:
         Returns:
             DataFrame containing all measurements
         """
-        return pd.DataFrame(self.measurements)
+        if not self._n:
+            return pd.DataFrame()
+
+        n = self._n
+        data = {name: self._columns[name][:n] for name in _COLUMN_ORDER}
+        data['timestamp'] = self._format_timestamps(data['timestamp']).astype(object)
+        data['band'] = self._decode_bands(data['band'])
+        data['signal_dbm'] = self._export_signal(data['signal_dbm'])
+        data['session_id'] = self.session_id
+        return pd.DataFrame(data)
 
     def get_measurements_by_band(self, band_name: str) -> List[Dict]:
         """
@@ -183,7 +707,12 @@ class DataLogger:
         Returns:
             List of measurement dictionaries
         """
-        return [m for m in self.measurements if m['band'] == band_name]
+        code = self._band_codes.get(band_name)
+        if code is None:
+            return []
+
+        mask = self._columns['band'][:self._n] == code
+        return self._rows(np.flatnonzero(mask))
 
     def get_measurements_by_location(self,
                                     latitude: float,
@@ -206,18 +735,34 @@ class DataLogger:
         import math
         lon_delta = radius_meters / (111000 * max(0.01, abs(math.cos(math.radians(latitude)))))
 
-        nearby = []
-        for m in self.measurements:
-            if m['latitude'] is None or m['longitude'] is None:
-                continue
+        # Candidates within the larger half-width (Chebyshev ball), then the exact box
+        tree, rows = self._spatial_index()
+        if tree is None:
+            return []
+
+        candidates = rows[tree.query_ball_point([latitude, longitude], r=max(lat_delta, lon_delta), p=np.inf)]
+        lat_diff = np.abs(self._columns['latitude'][candidates] - latitude)
+        lon_diff = np.abs(self._columns['longitude'][candidates] - longitude)
 
-            lat_diff = abs(m['latitude'] - latitude)
-            lon_diff = abs(m['longitude'] - longitude)
+        mask = (lat_diff <= lat_delta) & (lon_diff <= lon_delta)
+        return self._rows(np.sort(candidates[mask]))
 
-            if lat_diff <= lat_delta and lon_diff <= lon_delta:
-                nearby.append(m)
+    def _spatial_index(self) -> Tuple[Optional[cKDTree], np.ndarray]:
+        """
+        KD-tree over the logged positions, rebuilt only after new measurements
 
-        return nearby
+        Returns:
+            Tuple of (tree or None if no row has a position, row index of each tree point)
+        """
+        if self._kdtree_n != self._n:
+            n = self._n
+            lats = self._columns['latitude'][:n]
+            lons = self._columns['longitude'][:n]
+            rows = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+            tree = cKDTree(np.column_stack((lats[rows], lons[rows]))) if len(rows) else None
+            self._kdtree = (tree, rows)
+            self._kdtree_n = n
+        return self._kdtree
 
     def get_summary_statistics(self) -> Dict:
         """
@@ -226,44 +771,62 @@ class DataLogger:
         Returns:
             Dictionary of statistics
         """
-        if not self.measurements:
+        if not self._n:
             return {}
 
-        df = self.get_dataframe()
+        # Reduce the columns directly; no DataFrame is built
+        n = self._n
+        signals = self._columns['signal_dbm'][:n]
+        lats = self._columns['latitude'][:n]
+        lons = self._columns['longitude'][:n]
+        has_gps = int(np.count_nonzero(~np.isnan(lats)))
 
         stats = {
-            'total_measurements': len(self.measurements),
+            'total_measurements': n,
             'session_id': self.session_id,
-            'bands_scanned': df['band'].unique().tolist(),
+            'bands_scanned': [self._band_names[i] for i in np.unique(self._columns['band'][:n])],
             'signal_stats': {
-                'min_dbm': float(df['signal_dbm'].min()),
-                'max_dbm': float(df['signal_dbm'].max()),
-                'mean_dbm': float(df['signal_dbm'].mean()),
-                'median_dbm': float(df['signal_dbm'].median())
+                'min_dbm': round(float(np.nanmin(signals)), SIGNAL_DECIMALS),
+                'max_dbm': round(float(np.nanmax(signals)), SIGNAL_DECIMALS),
+                'mean_dbm': round(float(np.nanmean(signals, dtype=np.float64)), SIGNAL_DECIMALS),
+                'median_dbm': round(float(np.nanmedian(signals)), SIGNAL_DECIMALS)
             },
             'spatial_coverage': {
-                'has_gps': df['latitude'].notna().sum(),
-                'no_gps': df['latitude'].isna().sum()
+                'has_gps': has_gps,
+                'no_gps': n - has_gps
             }
         }
 
-        if df['latitude'].notna().any():
+        if has_gps:
             stats['spatial_coverage']['lat_range'] = [
-                float(df['latitude'].min()),
-                float(df['latitude'].max())
+                float(np.nanmin(lats)),
+                float(np.nanmax(lats))
             ]
             stats['spatial_coverage']['lon_range'] = [
-                float(df['longitude'].min()),
-                float(df['longitude'].max())
+                float(np.nanmin(lons)),
+                float(np.nanmax(lons))
             ]
 
         return stats
 
     def clear_measurements(self):
         """Clear all measurements from memory"""
-        self.measurements = []
+        self._n = 0
+        self._allocate(_INITIAL_CAPACITY)
+        self._band_names = []
+        self._band_codes = {}
+        self._kdtree = (None, np.empty(0, dtype=np.intp))
+        self._kdtree_n = 0
+        self._histograms = {}
         logger.info("Cleared all measurements from memory")
 
+    def close(self):
+        """Flush and close the streamed session CSV"""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+
     def __len__(self):
         """Return number of measurements"""
-        return len(self.measurements)
+        return self._n
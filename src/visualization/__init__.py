@@ -1,5 +1,5 @@
 """Visualization package for cell signal mapping data"""
 
-from .interactive_heatmap import InteractiveHeatmapGenerator
+from .interactive_heatmap import FlightTable, InteractiveHeatmapGenerator
 
-__all__ = ['InteractiveHeatmapGenerator']
+__all__ = ['FlightTable', 'InteractiveHeatmapGenerator']
@@ -4,8 +4,11 @@ Creates beautiful interactive web maps from cell signal data
 Optimized for single-band (Band 5 LTE 850 MHz) data
 """
 
+import gzip
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
@@ -13,12 +16,247 @@ from datetime import datetime
 import numpy as np
 import folium
 from folium import plugins
-from scipy.interpolate import griddata
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
+from scipy.spatial import cKDTree
+
+# Flight logs are parsed with orjson when installed, json otherwise
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Inverse distance weighting: samples per grid cell and distance exponent
+IDW_NEIGHBORS = 8
+IDW_POWER = 2
+# Weights and interpolated values are stored in single precision: the grid is
+# rendered through a colormap, far coarser than float32 resolution
+GRID_DTYPE = np.float32
+# Default cap on interpolation grid cells; larger areas get a coarser grid
+MAX_GRID_CELLS = 4_000_000
+
+# Decimals kept for coordinates and weights written into the map (~0.1 m)
+MAP_DECIMALS = 6
+
+# Default cap on location markers; denser data is only drawn by the heat layer
+MAX_MARKERS = 2000
+
+# Per signal level, weakest first: below poor, poor, fair, good, excellent and up
+SIGNAL_COLORS = ('#ff0000', '#ff8800', '#ffff00', '#7fff00', '#00ff00')
+SIGNAL_QUALITIES = (
+    ("Poor", "⭐"),
+    ("Weak", "⭐⭐"),
+    ("Fair", "⭐⭐⭐"),
+    ("Good", "⭐⭐⭐⭐"),
+    ("Excellent", "⭐⭐⭐⭐⭐"),
+)
+
+# Location markers are drawn in the browser from compact rows of
+# [lat, lon, avg_signal, samples, level, number, altitude, frequency, timestamp];
+# this callback turns one row into a circle marker with its popup
+MARKER_CALLBACK = """(function () {
+    var colors = %s;
+    var qualities = %s;
+    return function (row) {
+        var color = colors[row[4]];
+        var quality = qualities[row[4]];
+        var timestamp = row[8] ? row[8].split('T') : ['N/A', ''];
+        var popup = `
+<div style="font-family: Arial; min-width: 200px;">
+    <h4 style="margin: 0 0 10px 0;">📍 Location #${row[5]}</h4>
+    <hr style="margin: 5px 0;">
+    <p style="margin: 5px 0;"><b>🛰️ Signal Strength</b></p>
+    <p style="margin: 5px 0 5px 20px;">
+        ${row[2].toFixed(1)} dBm<br>
+        Quality: ${quality[0]} ${quality[1]}<br>
+        (${row[3]} samples)
+    </p>
+    <p style="margin: 5px 0;"><b>📍 Location</b></p>
+    <p style="margin: 5px 0 5px 20px;">
+        Lat: ${row[0].toFixed(6)}°<br>
+        Lon: ${row[1].toFixed(6)}°<br>
+        Alt: ${row[6] === null ? 'N/A' : row[6]}m
+    </p>
+    <p style="margin: 5px 0;"><b>📻 Frequency</b></p>
+    <p style="margin: 5px 0 5px 20px;">${row[7] === null ? 'N/A' : row[7].toFixed(2)} MHz</p>
+    <p style="margin: 5px 0;"><b>🕒 Time</b></p>
+    <p style="margin: 5px 0 5px 20px;">${timestamp[0]}<br>
+    ${(timestamp[1] || '').slice(0, 8)}</p>
+</div>`;
+        return L.circleMarker(new L.LatLng(row[0], row[1]), {
+            radius: 4,
+            color: color,
+            fill: true,
+            fillColor: color,
+            fillOpacity: 0.7,
+            weight: 1
+        }).bindPopup(popup, {maxWidth: 300});
+    };
+})()""" % (json.dumps(SIGNAL_COLORS), json.dumps(SIGNAL_QUALITIES))
+
+
+def _parse_timestamps(values: List[Optional[str]]) -> np.ndarray:
+    """
+    Parse ISO timestamp strings to datetime64[s] in one vectorized conversion
+
+    Args:
+        values: ISO 8601 timestamp strings (None if missing)
+
+    Returns:
+        datetime64[s] array, NaT where a timestamp is missing or unparseable
+    """
+    try:
+        return np.array(values, dtype=object).astype('datetime64[s]')
+    except ValueError:
+        # Some entry is malformed; parse one by one and blank out the bad ones
+        parsed = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[s]')
+        for i, value in enumerate(values):
+            try:
+                parsed[i] = np.datetime64(value, 's')
+            except (ValueError, TypeError):
+                pass
+        return parsed
+
+
+class FlightTable:
+    """Flight log measurements held column-wise, one array per field"""
+
+    def __init__(self,
+                 lats: np.ndarray,
+                 lons: np.ndarray,
+                 signals: np.ndarray,
+                 altitudes: np.ndarray,
+                 frequencies: np.ndarray,
+                 bands: np.ndarray,
+                 band_names: List[Optional[str]],
+                 timestamps: np.ndarray):
+        """
+        Initialize from column arrays of equal length
+
+        Args:
+            lats: Latitudes (NaN if missing)
+            lons: Longitudes (NaN if missing)
+            signals: Signal strengths in dBm (NaN if missing)
+            altitudes: Altitudes in meters (NaN if missing)
+            frequencies: Frequencies in MHz (NaN if missing)
+            bands: Integer band codes indexing band_names
+            band_names: Band name of each code
+            timestamps: datetime64[s] array (NaT if missing)
+        """
+        self.lats = lats
+        self.lons = lons
+        self.signals = signals
+        self.altitudes = altitudes
+        self.frequencies = frequencies
+        self.bands = bands
+        self.band_names = band_names
+        self.timestamps = timestamps
+
+    @classmethod
+    def from_measurements(cls, measurements: List[Dict]) -> 'FlightTable':
+        """
+        Build the table in one pass per field over measurement dictionaries
+
+        Args:
+            measurements: List of measurement dictionaries
+
+        Returns:
+            FlightTable with one row per measurement
+        """
+        def floats(key: str) -> np.ndarray:
+            # None becomes NaN
+            return np.array([m.get(key) for m in measurements], dtype=np.float64)
+
+        codes: Dict[Optional[str], int] = {}
+        bands = np.fromiter((codes.setdefault(m.get('band'), len(codes)) for m in measurements),
+                            dtype=np.int32, count=len(measurements))
+
+        return cls(
+            lats=floats('latitude'),
+            lons=floats('longitude'),
+            signals=floats('signal_dbm'),
+            altitudes=floats('altitude'),
+            frequencies=floats('frequency_mhz'),
+            bands=bands,
+            band_names=list(codes),
+            timestamps=_parse_timestamps([m.get('timestamp') for m in measurements])
+        )
+
+    @classmethod
+    def load(cls, path: Path, source_stamp: Optional[Tuple[int, int]] = None) -> Optional['FlightTable']:
+        """
+        Load a table written by save()
+
+        Args:
+            path: Path to the .npz file
+            source_stamp: Expected (mtime_ns, size) of the source flight log
+
+        Returns:
+            FlightTable, or None if it was saved from a different version of the source
+        """
+        with np.load(path) as data:
+            if source_stamp is not None and (
+                    'source' not in data or tuple(data['source'].tolist()) != tuple(source_stamp)):
+                return None
+            return cls(
+                lats=data['lats'],
+                lons=data['lons'],
+                signals=data['signals'],
+                altitudes=data['altitudes'],
+                frequencies=data['frequencies'],
+                bands=data['bands'],
+                band_names=[name or None for name in data['band_names'].tolist()],
+                timestamps=data['timestamps'].astype('datetime64[s]')
+            )
+
+    def save(self, path: Path, source_stamp: Optional[Tuple[int, int]] = None):
+        """
+        Write the columns to an uncompressed .npz file
+
+        Band names are stored as a fixed-width unicode array (missing as an
+        empty string) so loading never needs pickle.
+
+        Args:
+            path: Destination path
+            source_stamp: (mtime_ns, size) of the source flight log, checked by load()
+        """
+        extra = {} if source_stamp is None else {'source': np.array(source_stamp, dtype=np.int64)}
+        # Write then rename, so an interrupted save never leaves a truncated cache
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                lats=self.lats,
+                lons=self.lons,
+                signals=self.signals,
+                altitudes=self.altitudes,
+                frequencies=self.frequencies,
+                bands=self.bands,
+                band_names=np.array([name or '' for name in self.band_names], dtype=str),
+                timestamps=self.timestamps,
+                **extra
+            )
+        os.replace(tmp_path, path)
+
+    def band_mask(self, band_name: str) -> np.ndarray:
+        """
+        Select the rows of one band
+
+        Args:
+            band_name: Name of the band
+
+        Returns:
+            Boolean mask over the rows
+        """
+        if band_name not in self.band_names:
+            return np.zeros(len(self.bands), dtype=bool)
+        return self.bands == self.band_names.index(band_name)
+
+    def __len__(self):
+        """Return number of rows"""
+        return len(self.bands)
+
 
 class InteractiveHeatmapGenerator:
     """
@@ -41,6 +279,20 @@ class InteractiveHeatmapGenerator:
         self.heatmap_config = config['visualization'].get('heatmap', {})
         self.signal_thresholds = config['visualization'].get('signal_thresholds', {})
 
+        # Quality cut-offs in ascending order; a signal's level is how many it reaches
+        self._level_bounds = np.array([
+            self.signal_thresholds.get('poor', -90),
+            self.signal_thresholds.get('fair', -80),
+            self.signal_thresholds.get('good', -70),
+            self.signal_thresholds.get('excellent', -60),
+        ], dtype=float)
+
+        # Last interpolation layout, reused while the sample positions match
+        self._idw_cache: Optional[Tuple[bytes, int, Tuple]] = None
+
+        # Last flight table loaded, keyed by (path, mtime_ns, size) of its JSON
+        self._table_cache: Optional[Tuple[Tuple[str, int, int], FlightTable]] = None
+
     def load_flight_data(self, json_path: str) -> List[Dict]:
         """
         Load flight data from JSON file
@@ -53,8 +305,7 @@ class InteractiveHeatmapGenerator:
         """
         logger.info(f"Loading flight data from {json_path}")
 
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        data = _json_loads(Path(json_path).read_bytes())
 
         measurements = data.get('measurements', [])
         logger.info(f"Loaded {len(measurements)} measurements")
@@ -72,6 +323,64 @@ class InteractiveHeatmapGenerator:
 
         return valid_measurements
 
+    def load_flight_table(self, json_path: str) -> FlightTable:
+        """
+        Load flight data from JSON file as columns, cached in memory and on disk
+
+        The last table loaded is kept on the generator, so rendering one map
+        per band from the same log parses it once. The parsed columns are
+        also saved as a .npz next to the JSON file, tagged with the JSON's
+        mtime and size, and reused by later runs while both match. Disable the file with
+        visualization.heatmap.flight_cache.
+
+        Args:
+            json_path: Path to JSON file from scan
+
+        Returns:
+            FlightTable of measurements with valid GPS coordinates
+        """
+        json_stat = Path(json_path).stat()
+        key = (str(Path(json_path).resolve()), json_stat.st_mtime_ns, json_stat.st_size)
+        if self._table_cache is not None and self._table_cache[0] == key:
+            return self._table_cache[1]
+
+        table = self._read_flight_table(json_path, key[1:])
+        self._table_cache = (key, table)
+        return table
+
+    def _read_flight_table(self, json_path: str, source_stamp: Tuple[int, int]) -> FlightTable:
+        """
+        Read a flight table from its .npz cache, or parse the JSON and write the cache
+
+        Args:
+            json_path: Path to JSON file from scan
+            source_stamp: (mtime_ns, size) of the JSON file
+
+        Returns:
+            FlightTable of measurements with valid GPS coordinates
+        """
+        use_cache = self.heatmap_config.get('flight_cache', True)
+        cache_path = Path(json_path).with_suffix('.npz')
+
+        if use_cache and cache_path.exists():
+            try:
+                table = FlightTable.load(cache_path, source_stamp)
+                if table is not None:
+                    logger.info(f"Loaded {len(table)} measurements from cache {cache_path}")
+                    return table
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable flight cache {cache_path}: {e}")
+
+        table = FlightTable.from_measurements(self.load_flight_data(json_path))
+
+        if use_cache:
+            try:
+                table.save(cache_path, source_stamp)
+            except OSError as e:
+                logger.warning(f"Could not write flight cache {cache_path}: {e}")
+
+        return table
+
     def extract_signal_data(self, measurements: List[Dict], band_name: str = 'band_5') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Extract coordinates and signal strength for a specific band
@@ -83,31 +392,31 @@ class InteractiveHeatmapGenerator:
         Returns:
             Tuple of (latitudes, longitudes, signal_strengths) as numpy arrays
         """
-        lats = []
-        lons = []
-        signals = []
+        lats, lons, signals, _ = self._valid_signal_rows(FlightTable.from_measurements(measurements), band_name)
+        return lats, lons, signals
 
-        for m in measurements:
-            lat = m.get('latitude')
-            lon = m.get('longitude')
+    @staticmethod
+    def _valid_signal_rows(table: FlightTable,
+                           band_name: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Extract a band's usable samples and remember which rows they came from
 
-            # Check if this measurement is for the requested band
-            if m.get('band') != band_name:
-                continue
+        Args:
+            table: Flight log columns
+            band_name: Band to extract
 
-            # Get signal strength directly from measurement
-            signal = m.get('signal_dbm')
+        Returns:
+            Tuple of (latitudes, longitudes, signal_strengths, row_indices)
+        """
+        lats, lons, signals = table.lats, table.lons, table.signals
 
-            if lat is not None and lon is not None and signal is not None:
-                # Filter out invalid signal values
-                if -150 < signal < -30:  # Reasonable range for cell signals
-                    lats.append(lat)
-                    lons.append(lon)
-                    signals.append(signal)
+        # NaN fails every comparison, so missing values drop out here too
+        valid = (table.band_mask(band_name) & ~np.isnan(lats) & ~np.isnan(lons)
+                 & (signals > -150) & (signals < -30))  # Reasonable range for cell signals
 
-        logger.info(f"Extracted {len(signals)} valid signal measurements for {band_name}")
+        logger.info(f"Extracted {np.count_nonzero(valid)} valid signal measurements for {band_name}")
 
-        return np.array(lats), np.array(lons), np.array(signals)
+        return lats[valid], lons[valid], signals[valid], np.flatnonzero(valid)
 
     def interpolate_grid(self, lats: np.ndarray, lons: np.ndarray, signals: np.ndarray,
                         resolution_meters: int = 10) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -121,10 +430,43 @@ class InteractiveHeatmapGenerator:
             resolution_meters: Grid resolution in meters
 
         Returns:
-            Tuple of (grid_lats, grid_lons, grid_signals)
+            Tuple of (grid_lats, grid_lons, grid_signals); the coordinate
+            meshes are sparse (1 x lat and lon x 1) and broadcast against
+            grid_signals (lon x lat, float32)
         """
         logger.info("Interpolating signal data onto regular grid...")
 
+        grid_lat_mesh, grid_lon_mesh, idx, weights = self._idw_layout(lats, lons, resolution_meters)
+        shape = (grid_lon_mesh.shape[0], grid_lat_mesh.shape[1])
+        # Weights are normalized per grid point, so each value is one row dot product
+        grid_signals = np.einsum('ij,ij->i', weights, signals.astype(GRID_DTYPE)[idx]).reshape(shape)
+
+        logger.info(f"Created {shape[1]}x{shape[0]} interpolation grid")
+
+        return grid_lat_mesh, grid_lon_mesh, grid_signals
+
+    def _idw_layout(self, lats: np.ndarray, lons: np.ndarray,
+                    resolution_meters: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Build the grid and IDW neighbor weights for a set of sample positions
+
+        The layout depends only on where samples were taken, so bands measured
+        along the same flight path share it and only the weighted sum is redone.
+
+        Args:
+            lats: Latitude array
+            lons: Longitude array
+            resolution_meters: Grid resolution in meters
+
+        Returns:
+            Tuple of (grid_lats, grid_lons, neighbor_indices, neighbor_weights),
+            with each grid point's weights summing to 1
+        """
+        key = np.ascontiguousarray(lats).tobytes() + np.ascontiguousarray(lons).tobytes()
+        cached = self._idw_cache
+        if cached is not None and cached[1] == resolution_meters and cached[0] == key:
+            return cached[2]
+
         # Calculate bounding box
         lat_min, lat_max = lats.min(), lats.max()
         lon_min, lon_max = lons.min(), lons.max()
@@ -146,24 +488,120 @@ class InteractiveHeatmapGenerator:
         num_lat_points = max(20, int(lat_range_km * 1000 / resolution_meters))
         num_lon_points = max(20, int(lon_range_km * 1000 / resolution_meters))
 
-        # Create grid
+        # Cell count grows with the area; long flights at fine resolution would
+        # need hundreds of millions of cells, so coarsen both axes evenly instead
+        max_cells = self.heatmap_config.get('max_grid_cells', MAX_GRID_CELLS)
+        total_cells = num_lat_points * num_lon_points
+        if total_cells > max_cells:
+            scale = np.sqrt(max_cells / total_cells)
+            num_lat_points = max(20, int(num_lat_points * scale))
+            num_lon_points = max(20, int(num_lon_points * scale))
+            logger.info(f"Grid of {total_cells} cells exceeds {max_cells}: "
+                        f"using ~{resolution_meters / scale:.1f} m resolution")
+
+        # Create grid as sparse (broadcastable) meshes instead of two full arrays
         grid_lats = np.linspace(lat_min, lat_max, num_lat_points)
         grid_lons = np.linspace(lon_min, lon_max, num_lon_points)
-        grid_lat_mesh, grid_lon_mesh = np.meshgrid(grid_lats, grid_lons)
-
-        # Interpolate using griddata (IDW-like with linear method)
-        points = np.column_stack((lats, lons))
-        grid_signals = griddata(
-            points,
-            signals,
-            (grid_lat_mesh, grid_lon_mesh),
-            method='linear',
-            fill_value=np.nan
-        )
+        grid_lat_mesh, grid_lon_mesh = np.meshgrid(grid_lats, grid_lons, sparse=True, copy=False)
+
+        # Inverse distance weighting over the k nearest samples. Longitudes are
+        # scaled by cos(lat) so distances are roughly isotropic in meters.
+        lon_scale = np.cos(np.radians(lats.mean()))
+        tree = cKDTree(np.column_stack((lats, lons * lon_scale)))
+        k = min(IDW_NEIGHBORS, len(lats))
+
+        # Grid points in row-major (lon, lat) order, filled by broadcasting
+        query = np.empty((num_lon_points, num_lat_points, 2))
+        query[..., 0] = grid_lat_mesh
+        query[..., 1] = grid_lon_mesh * lon_scale
+        query = query.reshape(-1, 2)
+        # Grid cells are independent, so spread the lookup over all cores
+        dist, idx = tree.query(query, k=k, workers=-1)
+        if k == 1:
+            dist, idx = dist[:, None], idx[:, None]
+
+        weights = 1.0 / np.maximum(dist, 1e-12) ** IDW_POWER
+        # Normalized once here instead of on every band interpolated with this layout.
+        # Distances need double precision, the kept weights do not. Indices stay
+        # intp: narrower ones are converted back on every gather
+        weights /= weights.sum(axis=1, keepdims=True)
+        weights = weights.astype(GRID_DTYPE)
+
+        layout = (grid_lat_mesh, grid_lon_mesh, idx, weights)
+        self._idw_cache = (key, resolution_meters, layout)
+        return layout
+
+    @staticmethod
+    def group_by_location(measurements: List[Dict], decimals: int = 5) -> List[Tuple[float, float, float, int, Dict]]:
+        """
+        Bin measurements by rounded position and average the signal per bin
 
-        logger.info(f"Created {num_lat_points}x{num_lon_points} interpolation grid")
+        Args:
+            measurements: Measurement dictionaries with latitude/longitude
+            decimals: Decimal places coordinates are rounded to (5 ≈ 1 m)
 
-        return grid_lat_mesh, grid_lon_mesh, grid_signals
+        Returns:
+            List of (lat, lon, avg_signal, num_samples, first_measurement),
+            in order of each location's first appearance
+        """
+        if not measurements:
+            return []
+
+        lats = np.array([m['latitude'] for m in measurements], dtype=float)
+        lons = np.array([m['longitude'] for m in measurements], dtype=float)
+        signals = np.array([m['signal_dbm'] for m in measurements], dtype=float)
+
+        return [
+            (lat, lon, avg, count, measurements[first])
+            for lat, lon, avg, count, first in InteractiveHeatmapGenerator._location_groups(lats, lons, signals, decimals)
+        ]
+
+    @staticmethod
+    def _location_groups(lats: np.ndarray, lons: np.ndarray, signals: np.ndarray,
+                         decimals: int = 5) -> List[Tuple[float, float, float, int, int]]:
+        """
+        Bin samples by rounded position and average the signal per bin
+
+        All bins are computed in one pass over the coordinate arrays instead of
+        collecting a list of samples per location.
+
+        Args:
+            lats: Latitude array
+            lons: Longitude array
+            signals: Signal strength array
+            decimals: Decimal places coordinates are rounded to (5 ≈ 1 m)
+
+        Returns:
+            List of (lat, lon, avg_signal, num_samples, first_sample_index),
+            in order of each location's first appearance
+        """
+        if len(lats) == 0:
+            return []
+
+        coords = np.round(np.column_stack((lats, lons)), decimals)
+        keys, first, inverse = np.unique(coords, axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.ravel()
+        counts = np.bincount(inverse)
+        averages = np.bincount(inverse, weights=signals) / counts
+
+        order = np.argsort(first)
+        return list(zip(keys[order, 0].tolist(), keys[order, 1].tolist(), averages[order].tolist(),
+                        counts[order].tolist(), first[order].tolist()))
+
+    def signal_levels(self, signals: np.ndarray) -> np.ndarray:
+        """
+        Classify signal strengths against the thresholds in one vectorized lookup
+
+        Args:
+            signals: Signal strengths in dBm
+
+        Returns:
+            Level per signal, 0 (below poor) to 4 (excellent), indexing
+            SIGNAL_COLORS and SIGNAL_QUALITIES; NaN counts as below poor
+        """
+        signals = np.asarray(signals, dtype=float)
+        # searchsorted sorts NaN above every bound; it reaches no threshold
+        return np.where(np.isnan(signals), 0, np.searchsorted(self._level_bounds, signals, side='right'))
 
     def get_signal_color(self, signal_dbm: float) -> str:
         """
@@ -175,21 +613,7 @@ class InteractiveHeatmapGenerator:
         Returns:
             Color string (hex format)
         """
-        excellent = self.signal_thresholds.get('excellent', -60)
-        good = self.signal_thresholds.get('good', -70)
-        fair = self.signal_thresholds.get('fair', -80)
-        poor = self.signal_thresholds.get('poor', -90)
-
-        if signal_dbm >= excellent:
-            return '#00ff00'  # Bright green
-        elif signal_dbm >= good:
-            return '#7fff00'  # Yellow-green
-        elif signal_dbm >= fair:
-            return '#ffff00'  # Yellow
-        elif signal_dbm >= poor:
-            return '#ff8800'  # Orange
-        else:
-            return '#ff0000'  # Red
+        return SIGNAL_COLORS[self.signal_levels(signal_dbm)]
 
     def get_signal_quality(self, signal_dbm: float) -> Tuple[str, str]:
         """
@@ -201,21 +625,7 @@ class InteractiveHeatmapGenerator:
         Returns:
             Tuple of (quality_label, rating_stars)
         """
-        excellent = self.signal_thresholds.get('excellent', -60)
-        good = self.signal_thresholds.get('good', -70)
-        fair = self.signal_thresholds.get('fair', -80)
-        poor = self.signal_thresholds.get('poor', -90)
-
-        if signal_dbm >= excellent:
-            return "Excellent", "⭐⭐⭐⭐⭐"
-        elif signal_dbm >= good:
-            return "Good", "⭐⭐⭐⭐"
-        elif signal_dbm >= fair:
-            return "Fair", "⭐⭐⭐"
-        elif signal_dbm >= poor:
-            return "Weak", "⭐⭐"
-        else:
-            return "Poor", "⭐"
+        return SIGNAL_QUALITIES[self.signal_levels(signal_dbm)]
 
     def generate_interactive_map(self, json_path: str, band_name: str = 'band_5',
                                  output_filename: Optional[str] = None) -> Path:
@@ -228,13 +638,13 @@ class InteractiveHeatmapGenerator:
             output_filename: Optional custom output filename
 
         Returns:
-            Path to generated HTML file
+            Path to generated HTML file (.html.gz if visualization.compress_html is set)
         """
         logger.info(f"Generating interactive heatmap for {band_name}...")
 
-        # Load data
-        measurements = self.load_flight_data(json_path)
-        lats, lons, signals = self.extract_signal_data(measurements, band_name)
+        # Load data as columns; band selection and validity are masks over them
+        table = self.load_flight_table(json_path)
+        lats, lons, signals, rows = self._valid_signal_rows(table, band_name)
 
         if len(signals) == 0:
             raise ValueError(f"No valid signal data found for {band_name}")
@@ -254,103 +664,88 @@ class InteractiveHeatmapGenerator:
         # Add satellite layer option
         folium.TileLayer('Esri.WorldImagery', name='Satellite', overlay=False).add_to(m)
 
-        # Create heatmap data (for folium HeatMap plugin)
-        # Format: [[lat, lon, weight], ...]
-        # Normalize signals to 0-1 range for heatmap
-        signal_min, signal_max = signals.min(), signals.max()
-        signal_normalized = (signals - signal_min) / (signal_max - signal_min) if signal_max > signal_min else np.ones_like(signals)
-
-        heatmap_data = [
-            [lat, lon, weight]
-            for lat, lon, weight in zip(lats, lons, signal_normalized)
-        ]
-
-        # Add heatmap layer
-        heatmap = plugins.HeatMap(
-            heatmap_data,
-            name='Signal Heatmap',
-            min_opacity=self.heatmap_config.get('min_opacity', 0.4),
-            max_zoom=self.heatmap_config.get('max_zoom', 18),
-            radius=self.heatmap_config.get('radius_pixels', 15),
-            blur=20,
-            gradient={
-                0.0: 'darkred',
-                0.3: 'red',
-                0.5: 'orange',
-                0.7: 'yellow',
-                0.85: 'yellowgreen',
-                1.0: 'green'
-            }
-        )
-        m.add_child(heatmap)
+        # A heat surface from a handful of samples is just noise; show markers only
+        min_points = self.heatmap_config.get('min_points', 12)
+        if len(signals) < min_points:
+            logger.info(f"Only {len(signals)} measurements (< {min_points}): skipping heatmap layer")
+        else:
+            # Create heatmap data (for folium HeatMap plugin)
+            # Format: [[lat, lon, weight], ...], filled as one (N, 3) array
+            # Normalize signals to 0-1 range for heatmap
+            signal_min, signal_max = signals.min(), signals.max()
+            heat = np.empty((len(signals), 3))
+            heat[:, 0] = lats
+            heat[:, 1] = lons
+            heat[:, 2] = (signals - signal_min) / (signal_max - signal_min) if signal_max > signal_min else 1.0
+
+            # Rounded values serialize to short JSON numbers
+            heatmap_data = np.round(heat, MAP_DECIMALS).tolist()
+
+            # Add heatmap layer
+            heatmap = plugins.HeatMap(
+                heatmap_data,
+                name='Signal Heatmap',
+                min_opacity=self.heatmap_config.get('min_opacity', 0.4),
+                max_zoom=self.heatmap_config.get('max_zoom', 18),
+                radius=self.heatmap_config.get('radius_pixels', 15),
+                blur=20,
+                gradient={
+                    0.0: 'darkred',
+                    0.3: 'red',
+                    0.5: 'orange',
+                    0.7: 'yellow',
+                    0.85: 'yellowgreen',
+                    1.0: 'green'
+                }
+            )
+            m.add_child(heatmap)
 
         # Add individual data points as markers
-        # Group measurements by location (lat/lon) to avoid too many markers
-        location_groups = {}
-        for measurement in measurements:
-            if measurement.get('band') == band_name:
-                lat = measurement.get('latitude')
-                lon = measurement.get('longitude')
-                if lat and lon:
-                    key = (round(lat, 5), round(lon, 5))  # Group nearby points
-                    if key not in location_groups:
-                        location_groups[key] = []
-                    location_groups[key].append(measurement)
-
-        marker_cluster = plugins.MarkerCluster(name='Data Points')
-
-        for i, (loc_key, loc_measurements) in enumerate(location_groups.items()):
-            # Use average signal for this location
-            avg_signal = np.mean([m['signal_dbm'] for m in loc_measurements])
-            lat, lon = loc_key
-
-            quality, rating = self.get_signal_quality(avg_signal)
-            color = self.get_signal_color(avg_signal)
-
-            # Get first measurement for time/altitude
-            first_m = loc_measurements[0]
-
-            # Create popup HTML
-            popup_html = f"""
-            <div style="font-family: Arial; min-width: 200px;">
-                <h4 style="margin: 0 0 10px 0;">📍 Location #{i+1}</h4>
-                <hr style="margin: 5px 0;">
-                <p style="margin: 5px 0;"><b>🛰️ Signal Strength</b></p>
-                <p style="margin: 5px 0 5px 20px;">
-                    {avg_signal:.1f} dBm<br>
-                    Quality: {quality} {rating}<br>
-                    ({len(loc_measurements)} samples)
-                </p>
-                <p style="margin: 5px 0;"><b>📍 Location</b></p>
-                <p style="margin: 5px 0 5px 20px;">
-                    Lat: {lat:.6f}°<br>
-                    Lon: {lon:.6f}°<br>
-                    Alt: {first_m.get('altitude', 'N/A')}m
-                </p>
-                <p style="margin: 5px 0;"><b>📻 Frequency</b></p>
-                <p style="margin: 5px 0 5px 20px;">{first_m.get('frequency_mhz', 'N/A'):.2f} MHz</p>
-                <p style="margin: 5px 0;"><b>🕒 Time</b></p>
-                <p style="margin: 5px 0 5px 20px;">{first_m.get('timestamp', 'N/A').split('T')[0] if first_m.get('timestamp') else 'N/A'}<br>
-                {first_m.get('timestamp', 'N/A').split('T')[1][:8] if first_m.get('timestamp') and 'T' in first_m.get('timestamp') else ''}</p>
-            </div>
-            """
-
-            # Add marker
-            folium.CircleMarker(
-                location=[lat, lon],
-                radius=4,
-                popup=folium.Popup(popup_html, max_width=300),
-                color=color,
-                fill=True,
-                fillColor=color,
-                fillOpacity=0.7,
-                weight=1
-            ).add_to(marker_cluster)
-
+        # Group the extracted samples by location (lat/lon) to avoid too many markers
+        location_groups = self._location_groups(lats, lons, signals)
+
+        # Every marker is still a Leaflet layer in the browser; beyond the cap,
+        # keep an even spread along the flight (groups are in order of first visit)
+        max_markers = self.heatmap_config.get('max_markers', MAX_MARKERS)
+        marker_indices = range(len(location_groups))
+        if len(location_groups) > max_markers:
+            logger.info(f"{len(location_groups)} locations: showing {max_markers} evenly spaced markers")
+            marker_indices = np.unique(np.linspace(0, len(location_groups) - 1, max_markers).astype(int)).tolist()
+
+        # Quality level of every location in one lookup
+        levels = self.signal_levels([avg for _, _, avg, _, _ in location_groups]).tolist()
+
+        # One compact row per marker; MARKER_CALLBACK builds the markers and
+        # popups in the browser instead of serializing each one from Python
+        marker_rows = rows[[location_groups[i][4] for i in marker_indices]]
+        # Format all popup times in one call; 'NaT' marks a missing timestamp
+        marker_times = np.datetime_as_string(table.timestamps[marker_rows], unit='s').tolist()
+        marker_data = []
+        for i, row, time_text in zip(marker_indices, marker_rows, marker_times):
+            lat, lon, avg_signal, num_samples, _ = location_groups[i]
+            altitude = float(table.altitudes[row])
+            frequency = float(table.frequencies[row])
+            marker_data.append([
+                lat,
+                lon,
+                round(avg_signal, 1),
+                num_samples,
+                levels[i],
+                i + 1,
+                None if np.isnan(altitude) else altitude,
+                None if np.isnan(frequency) else frequency,
+                '' if time_text == 'NaT' else time_text
+            ])
+
+        marker_cluster = plugins.FastMarkerCluster(marker_data, callback=MARKER_CALLBACK, name='Data Points')
         marker_cluster.add_to(m)
 
-        # Add flight path
-        path_coords = [[lat, lon] for lat, lon in zip(lats, lons)]
+        # Add flight path; while hovering the drone logs many samples at the same
+        # spot, so only keep a vertex when the ~1 m cell changes
+        cells = np.round(np.column_stack((lats, lons)), 5)
+        moved = np.ones(len(cells), dtype=bool)
+        moved[1:] = (cells[1:] != cells[:-1]).any(axis=1)
+        path_coords = np.round(np.column_stack((lats, lons))[moved], MAP_DECIMALS).tolist()
         folium.PolyLine(
             path_coords,
             color='blue',
@@ -400,9 +795,108 @@ class InteractiveHeatmapGenerator:
             output_filename = f'interactive_map_{band_name}_{timestamp}.html'
 
         output_path = self.output_dir / output_filename
-        m.save(str(output_path))
+
+        # Render once and write the encoded bytes in one call; dense flights
+        # produce maps of tens of MB, which gzip shrinks several times over
+        html = m.get_root().render().encode('utf-8')
+        if self.config['visualization'].get('compress_html', False):
+            output_path = output_path.with_name(output_path.name + '.gz')
+            with gzip.open(output_path, 'wb', compresslevel=6) as f:
+                f.write(html)
+        else:
+            output_path.write_bytes(html)
 
         logger.info(f"✓ Interactive map saved to: {output_path}")
-        logger.info(f"  Open in browser to view!")
+        if output_path.suffix == '.gz':
+            logger.info(f"  Serve it with Content-Encoding: gzip, or gunzip it, to view in a browser")
+        else:
+            logger.info(f"  Open in browser to view!")
 
         return output_path
+
+    def generate_all_bands(self, json_path: str, bands: Optional[List[str]] = None,
+                           max_workers: Optional[int] = None) -> Dict[str, Path]:
+        """
+        Generate one interactive heatmap per band, rendering bands in parallel processes
+
+        The flight log is loaded once here and handed to each worker process
+        when it starts, so workers neither re-read nor re-parse it.
+
+        Args:
+            json_path: Path to JSON flight data file
+            bands: Bands to visualize (default: every band in the log)
+            max_workers: Worker processes (default: one per band, up to the CPU count)
+
+        Returns:
+            Dictionary mapping band name to generated HTML path; bands without
+            valid signal data are logged and left out
+        """
+        table = self.load_flight_table(json_path)
+        if bands is None:
+            bands = [band_name for band_name in table.band_names if band_name is not None]
+
+        workers = min(len(bands), max_workers or os.cpu_count() or 1)
+        logger.info(f"Generating interactive heatmaps for {len(bands)} bands with {workers} worker(s)...")
+
+        if workers <= 1:
+            outcomes = [self._render_band(json_path, band_name) for band_name in bands]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_map_worker,
+                                     initargs=(self.config, self._table_cache)) as pool:
+                outcomes = list(pool.map(_render_band_map, [json_path] * len(bands), bands))
+
+        paths = {}
+        for band_name, (output_path, error) in zip(bands, outcomes):
+            if error is not None:
+                logger.warning(f"Skipping {band_name}: {error}")
+            else:
+                paths[band_name] = output_path
+
+        return paths
+
+    def _render_band(self, json_path: str, band_name: str) -> Tuple[Optional[Path], Optional[str]]:
+        """
+        Generate one band's map, reporting missing data instead of raising
+
+        Args:
+            json_path: Path to JSON flight data file
+            band_name: Band to visualize
+
+        Returns:
+            Tuple of (output_path, None), or (None, error message) if the band has no usable data
+        """
+        try:
+            return self.generate_interactive_map(json_path, band_name=band_name), None
+        except ValueError as e:
+            return None, str(e)
+
+
+# Generator of a map worker process, set up once by _init_map_worker
+_worker_generator: Optional[InteractiveHeatmapGenerator] = None
+
+
+def _init_map_worker(config: Dict, table_cache: Optional[Tuple]):
+    """
+    Create the worker's generator, seeded with the flight table loaded by the parent
+
+    Args:
+        config: Configuration dictionary
+        table_cache: Parent generator's (key, FlightTable) cache entry
+    """
+    global _worker_generator
+    _worker_generator = InteractiveHeatmapGenerator(config)
+    _worker_generator._table_cache = table_cache
+
+
+def _render_band_map(json_path: str, band_name: str) -> Tuple[Optional[Path], Optional[str]]:
+    """
+    Generate one band's map in a worker process
+
+    Args:
+        json_path: Path to JSON flight data file
+        band_name: Band to visualize
+
+    Returns:
+        Tuple of (output_path, error message), as from InteractiveHeatmapGenerator._render_band
+    """
+    return _worker_generator._render_band(json_path, band_name)